@@ -19,4 +19,4 @@ if __name__ == '__main__':
     print("🚀 Starting BlockyHomework Flask Server...")
     print("📱 Open your browser and go to: http://localhost:5000")
     print("🎨 The beautiful UI will now load with CSS and JS!")
-    app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
+    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True) 
\ No newline at end of file
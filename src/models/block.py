@@ -39,17 +39,40 @@ class Block:
         self.transactions = transactions
         self.proof = proof
         self.previous_hash = previous_hash
+        self._hash_key = None
+        self._hash_value = None
         self.hash = self.calculate_hash()
     
+    def _content_key(self) -> tuple:
+        """Every field that feeds the block hash, cheap to build and compare.
+        
+        Numeric fields carry their type, since 1, 1.0 and True compare equal
+        but serialize differently.
+        """
+        return (self.index, type(self.index), self.timestamp, type(self.timestamp),
+                self.proof, type(self.proof), self.previous_hash, tuple(
+            (tx.sender, tx.recipient, tx.amount, type(tx.amount),
+             tx.timestamp, type(tx.timestamp), tx.signature, tx.hash)
+            for tx in self.transactions
+        ))
+    
     def calculate_hash(self) -> str:
         """
         Calculate the hash of the block using SHA-256.
         
+        The result is memoized against the block's content, so revalidating
+        an unchanged block skips the JSON serialization, while any edit to the
+        block or its transactions still yields a fresh hash.
+        
         Returns:
             str: The block's hash
         """
-        block_string = json.dumps(self.to_dict(), sort_keys=True)
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        key = self._content_key()
+        if key != self._hash_key:
+            block_string = json.dumps(self.to_dict(), sort_keys=True)
+            self._hash_value = hashlib.sha256(block_string.encode()).hexdigest()
+            self._hash_key = key
+        return self._hash_value
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -95,14 +118,32 @@ class Block:
         Returns:
             int: The valid proof of work
         """
-        target = '0' * difficulty
+        # Compare raw digest bytes; each zero byte is two leading hex zeros and an
+        # odd difficulty also needs the next byte's high nibble clear
+        zero_bytes, odd_nibble = divmod(difficulty, 2)
+        zeros = bytes(zero_bytes)
+        
+        # Serialize once around the proof so each attempt only hashes
+        # prefix-midstate + nonce + suffix instead of re-running json.dumps
+        block_dict = self.to_dict()
+        block_dict['proof'] = '__proof__'
+        prefix, _, suffix = json.dumps(block_dict, sort_keys=True).partition('"__proof__"')
+        base_hasher = hashlib.sha256(prefix.encode())
+        suffix = suffix.encode()
         
+        proof = self.proof
         while True:
-            self.proof += 1
-            self.hash = self.calculate_hash()
+            proof += 1
+            hasher = base_hasher.copy()
+            hasher.update(b'%d' % proof)
+            hasher.update(suffix)
+            digest = hasher.digest()
             
-            if self.hash[:difficulty] == target:
-                return self.proof
+            if digest[:zero_bytes] == zeros and (not odd_nibble or digest[zero_bytes] < 16):
+                self.proof = proof
+                self.hash = self._hash_value = digest.hex()
+                self._hash_key = self._content_key()
+                return proof
     
     def is_valid(self) -> bool:
         """
@@ -13,6 +13,16 @@ class Blockchain:
         self.mempool = Mempool()
         self.difficulty = MINING_DIFFICULTY
         self.block_reward = BLOCK_REWARD
+        self._cached_valid = True
+        self._validated_upto = 0
+        self.last_validated_tip = None
+        self._tx_index = {}
+        self._block_index = {}
+        self._address_index = {}
+        self._indexed_tx_counts = []
+        self._tx_indexed_upto = 0
+        self._tx_indexed_tip = None
+        self._tx_indexed_edits = Transaction.edit_count
         self.create_genesis_block()
     
     def create_genesis_block(self):
@@ -31,48 +41,77 @@ class Blockchain:
         
         self.chain.append(genesis_block)
     
+    def clear_to_genesis(self):
+        del self.chain[1:]
+        self.mempool = Mempool()
+        self.difficulty = MINING_DIFFICULTY
+    
     def get_latest_block(self) -> Block:
         return self.chain[-1]
     
     def add_transaction(self, transaction: Transaction) -> bool:
-        if not transaction.is_valid():
+        # Already confirmed; the mempool verifies the signature itself
+        if self.get_transaction_by_hash(transaction.hash) is not None:
             return False
         
         return self.mempool.add_transaction(transaction)
     
+    def add_transactions(self, transactions: List[Transaction]) -> int:
+        return self.mempool.add_transactions([
+            transaction for transaction in transactions
+            if self.get_transaction_by_hash(transaction.hash) is None
+        ])
+    
     def mine_block(self, miner_address: str) -> Optional[Block]:
-        if not self.mempool.get_transactions():
+        new_block = self.next_block_template()
+        if new_block is None:
+            return None
+        
+        # mine_proof_of_work leaves the winning proof and hash on the block
+        proof = new_block.mine_proof_of_work(self.difficulty)
+        if proof:
+            self.append_mined_block(new_block, miner_address)
+            return new_block
+        
+        return None
+    
+    def next_block_template(self) -> Optional[Block]:
+        # Unmined block over the pending transactions; None when there is nothing to mine
+        if not len(self.mempool):
             return None
         
         latest_block = self.get_latest_block()
-        new_block = Block(
+        return Block(
             index=latest_block.index + 1,
             transactions=self.mempool.get_transactions_for_block(),
             proof=0,
             previous_hash=latest_block.hash
         )
+    
+    def append_mined_block(self, new_block: Block, miner_address: str):
+        reward_transaction = Transaction(
+            sender="0",
+            recipient=miner_address,
+            amount=self.block_reward
+        )
+        new_block.transactions.insert(0, reward_transaction)
         
-        proof = new_block.mine_proof_of_work(self.difficulty)
-        if proof:
-            new_block.proof = proof
-            new_block.hash = new_block.calculate_hash()
-            
-            reward_transaction = Transaction(
-                sender="0",
-                recipient=miner_address,
-                amount=self.block_reward
-            )
-            new_block.transactions.insert(0, reward_transaction)
-            
-            self.chain.append(new_block)
-            
-            transaction_hashes = [tx.hash for tx in new_block.transactions[1:]]
-            self.mempool.clear_transactions(transaction_hashes)
-            
-            self.adjust_difficulty()
-            return new_block
+        self.chain.append(new_block)
         
-        return None
+        transaction_hashes = [tx.hash for tx in new_block.transactions[1:]]
+        self.mempool.clear_transactions(transaction_hashes)
+        
+        self.adjust_difficulty()
+    
+    def mine_until_empty(self, miner_address: str) -> List[Block]:
+        mined = []
+        mempool, mine_block = self.mempool, self.mine_block
+        while len(mempool):
+            block = mine_block(miner_address)
+            if block is None:
+                break
+            mined.append(block)
+        return mined
     
     def adjust_difficulty(self):
         if len(self.chain) % 10 == 0:
@@ -86,21 +125,35 @@ class Blockchain:
             elif avg_mining_time > target_time * 2:
                 self.difficulty = max(1, self.difficulty - 1)
     
+    def _block_links(self, index: int) -> bool:
+        current_block = self.chain[index]
+        previous_block = self.chain[index - 1]
+        
+        if current_block.previous_hash != previous_block.hash:
+            return False
+        
+        # is_valid() already compares the stored hash with calculate_hash()
+        return current_block.is_valid()
+    
     def validate_chain(self) -> bool:
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i-1]
-            
-            if current_block.previous_hash != previous_block.hash:
-                return False
-            
-            if not current_block.is_valid():
-                return False
-            
-            if current_block.hash != current_block.calculate_hash():
-                return False
+        return all(self._block_links(i) for i in range(1, len(self.chain)))
+    
+    def is_chain_valid(self) -> bool:
+        chain = self.chain
+        upto = self._validated_upto
+        if upto > len(chain) or (upto and chain[upto - 1].hash != self.last_validated_tip):
+            return self.force_revalidate()
         
-        return True
+        if self._cached_valid:
+            self._cached_valid = all(self._block_links(i) for i in range(max(upto, 1), len(chain)))
+        self._validated_upto = len(chain)
+        self.last_validated_tip = chain[-1].hash
+        return self._cached_valid
+    
+    def force_revalidate(self) -> bool:
+        self._cached_valid = True
+        self._validated_upto = 0
+        return self.is_chain_valid()
     
     def get_chain(self) -> List[Dict[str, Any]]:
         return [block.to_dict() for block in self.chain]
@@ -114,27 +167,70 @@ class Blockchain:
         return None
     
     def get_block_by_hash(self, block_hash: str) -> Optional[Block]:
-        for block in self.chain:
-            if block.hash == block_hash:
-                return block
-        return None
+        self._sync_indexes()
+        position = self._block_index.get(block_hash)
+        if position is None:
+            return None
+        
+        block = self.chain[position]
+        return block if block.hash == block_hash else None
+    
+    def _sync_indexes(self):
+        chain = self.chain
+        upto = self._tx_indexed_upto
+        counts = self._indexed_tx_counts
+        # Transactions appended to the indexed tip in place, or an edit to any transaction's
+        # fields, also force a rebuild; both checks stay O(1) in chain length
+        if (upto > len(chain) or (upto and chain[upto - 1].hash != self._tx_indexed_tip)
+                or (upto and len(chain[upto - 1].transactions) != counts[upto - 1])
+                or self._tx_indexed_edits != Transaction.edit_count):
+            self._tx_index = {}
+            self._block_index = {}
+            self._address_index = {}
+            counts = self._indexed_tx_counts = []
+            upto = 0
+        
+        tx_index = self._tx_index
+        block_index = self._block_index
+        address_index = self._address_index
+        for block_position in range(upto, len(chain)):
+            block = chain[block_position]
+            block_index.setdefault(block.hash, block_position)
+            counts.append(len(block.transactions))
+            for tx_position, transaction in enumerate(block.transactions):
+                location = (block_position, tx_position)
+                tx_index.setdefault(transaction.hash, location)
+                address_index.setdefault(transaction.sender, []).append(location)
+                if transaction.recipient != transaction.sender:
+                    address_index.setdefault(transaction.recipient, []).append(location)
+        
+        self._tx_indexed_upto = len(chain)
+        self._tx_indexed_tip = chain[-1].hash
+        self._tx_indexed_edits = Transaction.edit_count
     
     def get_transaction_by_hash(self, transaction_hash: str) -> Optional[Transaction]:
-        for block in self.chain:
-            for transaction in block.transactions:
-                if transaction.hash == transaction_hash:
-                    return transaction
-        return None
+        self._sync_indexes()
+        location = self._tx_index.get(transaction_hash)
+        if location is None:
+            return None
+        
+        transaction = self.chain[location[0]].transactions[location[1]]
+        return transaction if transaction.hash == transaction_hash else None
+    
+    def get_transactions_for_address(self, address: str) -> List[Transaction]:
+        self._sync_indexes()
+        chain = self.chain
+        transactions = (chain[b].transactions[t] for b, t in self._address_index.get(address, ()))
+        return [tx for tx in transactions if tx.sender == address or tx.recipient == address]
     
     def get_balance(self, address: str) -> float:
         balance = 0.0
         
-        for block in self.chain:
-            for transaction in block.transactions:
-                if transaction.recipient == address:
-                    balance += transaction.amount
-                if transaction.sender == address:
-                    balance -= transaction.amount
+        for transaction in self.get_transactions_for_address(address):
+            if transaction.recipient == address:
+                balance += transaction.amount
+            if transaction.sender == address:
+                balance -= transaction.amount
         
         return balance
     
@@ -142,17 +238,29 @@ class Blockchain:
         if len(new_chain) <= len(self.chain):
             return False
         
-        if not all(block.is_valid() for block in new_chain):
-            return False
-        
+        # Hash links are a cheap string compare, so reject broken chains before validating any block
         for i in range(1, len(new_chain)):
-            current_block = new_chain[i]
-            previous_block = new_chain[i-1]
-            
-            if current_block.previous_hash != previous_block.hash:
+            if new_chain[i].previous_hash != new_chain[i - 1].hash:
                 return False
         
+        # Blocks shared with the already-validated part of this chain skip the full check,
+        # as long as their memoized hash still matches; a block edited in place since it
+        # was validated ends the shared prefix and goes through is_valid() again
+        shared = 0
+        upto = self._validated_upto
+        chain = self.chain
+        if self._cached_valid and 0 < upto <= len(chain) and chain[upto - 1].hash == self.last_validated_tip:
+            while (shared < upto and new_chain[shared] is chain[shared]
+                   and chain[shared].hash == chain[shared].calculate_hash()):
+                shared += 1
+        
+        if not all(new_chain[i].is_valid() for i in range(shared, len(new_chain))):
+            return False
+        
         self.chain = new_chain
+        self._cached_valid = True
+        self._validated_upto = len(new_chain)
+        self.last_validated_tip = new_chain[-1].hash
         return True
     
     def to_dict(self) -> Dict[str, Any]:
@@ -1,3 +1,4 @@
+import heapq
 from typing import List, Dict, Any, Optional
 from .transaction import Transaction
 
@@ -5,22 +6,68 @@ from .transaction import Transaction
 class Mempool:
     def __init__(self):
         self.transactions = []
+        self._by_hash = {}
+        # (-fee, -timestamp, arrival, hash, edit version), so the heap top is the next tx
+        # to mine; entries no longer in _entries are dead and skipped when popped
+        self._fee_heap = []
+        self._entries = {}
+        # Transaction.edit_count when the entries were last checked against their transactions
+        self._edit_count = Transaction.edit_count
+        # Plain int: pickling itertools.count is deprecated in 3.12 and gone in 3.14
+        self._arrival = 0
         self.max_size = 1000
+        # Bumped on every change, so readers can tell whether a snapshot is stale
+        self.version = 0
     
     def add_transaction(self, transaction: Transaction) -> bool:
-        if not transaction.is_valid():
+        # Cheap capacity and duplicate checks first; signature verification last
+        if len(self.transactions) >= self.max_size:
             return False
         
-        if len(self.transactions) >= self.max_size:
+        if transaction.hash in self._by_hash:
             return False
         
-        if transaction.hash in [tx.hash for tx in self.transactions]:
+        if not transaction.is_valid():
             return False
         
-        self.transactions.append(transaction)
+        self._track(transaction)
         return True
     
+    def add_transactions(self, transactions: List[Transaction]) -> int:
+        added = 0
+        for transaction in transactions:
+            if len(self.transactions) >= self.max_size:
+                break
+            if transaction.hash in self._by_hash or not transaction.is_valid():
+                continue
+            self._track(transaction, push=False)
+            added += 1
+        
+        # One heapify for the whole batch instead of a push per transaction
+        if added:
+            heapq.heapify(self._fee_heap)
+        return added
+    
+    def _track(self, transaction: Transaction, push: bool = True):
+        self.version += 1
+        self.transactions.append(transaction)
+        self._by_hash[transaction.hash] = transaction
+        self._arrival += 1
+        entry = self._entries[transaction.hash] = self._fee_entry(transaction, self._arrival,
+                                                                  transaction.hash)
+        if push:
+            heapq.heappush(self._fee_heap, entry)
+        else:
+            self._fee_heap.append(entry)
+    
     def remove_transaction(self, transaction_hash: str) -> bool:
+        if self._by_hash.pop(transaction_hash, None) is None:
+            return False
+        
+        self.version += 1
+        del self._entries[transaction_hash]
+        self._compact_fee_heap()
+        
         for i, transaction in enumerate(self.transactions):
             if transaction.hash == transaction_hash:
                 del self.transactions[i]
@@ -33,13 +80,20 @@ class Mempool:
         return self.transactions[:limit]
     
     def get_transaction_by_hash(self, transaction_hash: str) -> Optional[Transaction]:
-        for transaction in self.transactions:
-            if transaction.hash == transaction_hash:
-                return transaction
-        return None
+        return self._by_hash.get(transaction_hash)
     
     def clear_transactions(self, transaction_hashes: List[str]):
-        self.transactions = [tx for tx in self.transactions if tx.hash not in transaction_hashes]
+        by_hash = self._by_hash
+        removed = [h for h in set(transaction_hashes) if by_hash.pop(h, None) is not None]
+        if not removed:
+            return
+        
+        self.version += 1
+        self.transactions = [tx for tx in self.transactions if tx.hash in by_hash]
+        entries = self._entries
+        for transaction_hash in removed:
+            del entries[transaction_hash]
+        self._compact_fee_heap()
     
     def get_pending_transactions(self) -> List[Transaction]:
         return self.transactions.copy()
@@ -53,17 +107,47 @@ class Mempool:
     def calculate_fee(self, transaction: Transaction) -> float:
         return max(0.001, transaction.amount * 0.001)
     
+    def _fee_entry(self, transaction: Transaction, arrival: int, key: str) -> tuple:
+        return (-self.calculate_fee(transaction), -transaction.timestamp,
+                arrival, key, transaction._edit_version)
+    
+    def _compact_fee_heap(self):
+        # Removal only drops the entry from _entries; rebuild once dead heap entries dominate
+        if len(self._fee_heap) > 2 * len(self._entries):
+            self._fee_heap = list(self._entries.values())
+            heapq.heapify(self._fee_heap)
+    
+    def _refresh_fee_heap(self):
+        # Pending transactions may be edited in place; once any transaction has been,
+        # re-key just the entries whose transaction changed since it was pushed
+        if self._edit_count == Transaction.edit_count:
+            return
+        self._edit_count = Transaction.edit_count
+        
+        by_hash, entries = self._by_hash, self._entries
+        for key, entry in entries.items():
+            if by_hash[key]._edit_version != entry[4]:
+                entries[key] = fresh = self._fee_entry(by_hash[key], entry[2], key)
+                heapq.heappush(self._fee_heap, fresh)
+        self._compact_fee_heap()
+    
     def prioritize_transactions(self) -> List[Transaction]:
-        sorted_transactions = sorted(
-            self.transactions,
-            key=lambda tx: (self.calculate_fee(tx), tx.timestamp),
-            reverse=True
-        )
-        return sorted_transactions
+        self._refresh_fee_heap()
+        return [self._by_hash[entry[3]] for entry in sorted(self._entries.values())]
     
     def get_transactions_for_block(self, max_transactions: int = 100) -> List[Transaction]:
-        prioritized = self.prioritize_transactions()
-        return prioritized[:max_transactions]
+        self._refresh_fee_heap()
+        heap, entries = self._fee_heap, self._entries
+        
+        # Pop the live top entries, dropping dead ones for good, then put the live ones back
+        top = []
+        while heap and len(top) < max_transactions:
+            entry = heapq.heappop(heap)
+            if entries.get(entry[3]) is entry:
+                top.append(entry)
+        for entry in top:
+            heapq.heappush(heap, entry)
+        return [self._by_hash[entry[3]] for entry in top]
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -78,11 +162,13 @@ class Mempool:
         mempool.max_size = data.get('max_size', 1000)
         
         for tx_data in data.get('transactions', []):
-            transaction = Transaction.from_dict(tx_data)
-            mempool.transactions.append(transaction)
+            mempool._track(Transaction.from_dict(tx_data))
         
         return mempool
     
+    def __len__(self) -> int:
+        return len(self.transactions)
+    
     def __str__(self) -> str:
         return f"Mempool: {len(self.transactions)} transactions"
     
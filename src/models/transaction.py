@@ -1,34 +1,102 @@
 import hashlib
 import json
+import math
 import time
+from json.encoder import encode_basestring_ascii
 from typing import Dict, Any, Optional
-from ecdsa import SigningKey, VerifyingKey, SECP256k1
-from ecdsa.util import sigencode_der, sigdecode_der
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from ecdsa import SigningKey, SECP256k1
+from ecdsa.util import sigencode_der
+
+# Verification runs through OpenSSL; ecdsa's default SHA-1 prehash and DER signatures are kept
+_CURVE = ec.SECP256K1()
+_SIGNATURE_ALGORITHM = ec.ECDSA(hashes.SHA1())
+
+# Byte-for-byte what json.dumps(..., sort_keys=True) emits for the hashed fields
+_HASH_TEMPLATE = '{"amount": %s, "recipient": %s, "sender": %s, "timestamp": %s}'
+
+
+def _json_number(value) -> Optional[str]:
+    """json.dumps text of a plain int or finite float; None for anything else."""
+    kind = type(value)
+    if kind is int:
+        return int.__repr__(value)
+    if kind is float and math.isfinite(value):
+        return float.__repr__(value)
+    return None
+
+
+# Fields whose edits can leave indexes and orderings built over a transaction stale
+_TRACKED_FIELDS = frozenset(('sender', 'recipient', 'amount', 'timestamp', 'hash'))
+_MISSING = object()
 
 
 class Transaction:
-    def __init__(self, sender: str, recipient: str, amount: float, signature: str = None):
+    # Bumped whenever a tracked field of an existing transaction changes value, so
+    # readers holding derived state can tell cheaply that something was edited;
+    # _edit_version counts the same edits per instance
+    edit_count = 0
+    _edit_version = 0
+    
+    def __init__(self, sender: str, recipient: str, amount: float, signature: str = None,
+                 timestamp: float = None):
         self.sender = sender
         self.recipient = recipient
         self.amount = amount
-        self.timestamp = time.time()
+        self.timestamp = time.time() if timestamp is None else timestamp
         self.signature = signature
+        self._hash_key = None
+        self._hash_value = None
         self.hash = self.calculate_hash()
     
+    def __setattr__(self, name, value):
+        if name in _TRACKED_FIELDS:
+            old = self.__dict__.get(name, _MISSING)
+            if old is not _MISSING and (type(old) is not type(value) or old != value):
+                Transaction.edit_count += 1
+                self.__dict__['_edit_version'] = self._edit_version + 1
+        object.__setattr__(self, name, value)
+    
     def calculate_hash(self) -> str:
-        transaction_string = json.dumps({
-            'sender': self.sender,
-            'recipient': self.recipient,
-            'amount': self.amount,
-            'timestamp': self.timestamp
-        }, sort_keys=True)
+        # Memoized against the hashed fields; types are part of the key since 1 and 1.0 serialize differently
+        key = (self.sender, self.recipient, self.amount, type(self.amount),
+               self.timestamp, type(self.timestamp))
+        if key != self._hash_key:
+            self._hash_value = self._compute_hash()
+            self._hash_key = key
+        return self._hash_value
+    
+    def _compute_hash(self) -> str:
+        amount = _json_number(self.amount)
+        timestamp = _json_number(self.timestamp)
+        if (amount is None or timestamp is None
+                or type(self.sender) is not str or type(self.recipient) is not str):
+            transaction_string = json.dumps({
+                'sender': self.sender,
+                'recipient': self.recipient,
+                'amount': self.amount,
+                'timestamp': self.timestamp
+            }, sort_keys=True)
+        else:
+            transaction_string = _HASH_TEMPLATE % (
+                amount, encode_basestring_ascii(self.recipient),
+                encode_basestring_ascii(self.sender), timestamp
+            )
         return hashlib.sha256(transaction_string.encode()).hexdigest()
     
     def sign_transaction(self, private_key: str) -> bool:
         try:
             signing_key = SigningKey.from_string(bytes.fromhex(private_key), curve=SECP256k1)
-            transaction_hash = self.calculate_hash()
-            signature = signing_key.sign(transaction_hash.encode(), sigencode=sigencode_der)
+        except Exception:
+            return False
+        return self.sign_with_key(signing_key)
+    
+    def sign_with_key(self, signing_key: SigningKey) -> bool:
+        try:
+            # Sign the current fields, not a hash cached before an edit
+            self.hash = self.calculate_hash()
+            signature = signing_key.sign(self.hash.encode(), sigencode=sigencode_der)
             self.signature = signature.hex()
             return True
         except Exception:
@@ -39,10 +107,15 @@ class Transaction:
             return False
         
         try:
-            verifying_key = VerifyingKey.from_string(bytes.fromhex(self.sender), curve=SECP256k1)
+            point = bytes.fromhex(self.sender)
+            if len(point) == 64:
+                # Raw X||Y, as Wallet.public_key stores it
+                point = b'\x04' + point
+            verifying_key = ec.EllipticCurvePublicKey.from_encoded_point(_CURVE, point)
             transaction_hash = self.calculate_hash()
             signature_bytes = bytes.fromhex(self.signature)
-            return verifying_key.verify(signature_bytes, transaction_hash.encode(), sigdecode=sigdecode_der)
+            verifying_key.verify(signature_bytes, transaction_hash.encode(), _SIGNATURE_ALGORITHM)
+            return True
         except Exception:
             return False
     
@@ -73,11 +146,12 @@ class Transaction:
         transaction = cls(
             sender=data['sender'],
             recipient=data['recipient'],
-            amount=data['amount']
+            amount=data['amount'],
+            signature=data.get('signature'),
+            timestamp=data.get('timestamp')
         )
-        transaction.timestamp = data.get('timestamp', time.time())
-        transaction.signature = data.get('signature')
-        transaction.hash = data.get('hash', transaction.calculate_hash())
+        if 'hash' in data:
+            transaction.hash = data['hash']
         return transaction
     
     def __str__(self) -> str:
@@ -28,16 +28,7 @@ class Wallet:
         return hashlib.sha256(address_string.encode()).hexdigest()
     
     def get_balance(self, blockchain) -> float:
-        balance = 0.0
-        
-        for block in blockchain.chain:
-            for transaction in block.transactions:
-                if transaction.recipient == self.address:
-                    balance += transaction.amount
-                if transaction.sender == self.address:
-                    balance -= transaction.amount
-        
-        return balance
+        return blockchain.get_balance(self.address)
     
     def create_transaction(self, recipient: str, amount: float) -> Transaction:
         transaction = Transaction(
@@ -46,9 +37,19 @@ class Wallet:
             amount=amount
         )
         
-        transaction.sign_transaction(self.private_key)
+        transaction.sign_with_key(self.signing_key)
         return transaction
     
+    def create_transactions(self, recipients: List[str], amounts: List[float]) -> List[Transaction]:
+        signing_key = self.signing_key
+        transactions = [
+            Transaction(sender=self.address, recipient=recipient, amount=amount)
+            for recipient, amount in zip(recipients, amounts)
+        ]
+        for transaction in transactions:
+            transaction.sign_with_key(signing_key)
+        return transactions
+    
     def sign_transaction(self, transaction: Transaction) -> bool:
         return transaction.sign_transaction(self.private_key)
     
@@ -56,14 +57,7 @@ class Wallet:
         return transaction.verify_signature()
     
     def get_transaction_history(self, blockchain) -> List[Transaction]:
-        history = []
-        
-        for block in blockchain.chain:
-            for transaction in block.transactions:
-                if transaction.sender == self.address or transaction.recipient == self.address:
-                    history.append(transaction)
-        
-        return history
+        return blockchain.get_transactions_for_address(self.address)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -4,7 +4,7 @@ HTTP client for node communication.
 """
 
 import requests
-import json
+import orjson
 import time
 import logging
 from typing import Dict, Any, Optional, List, Tuple
@@ -84,6 +84,7 @@ class BlockchainClient:
             return None
         
         url = urljoin(self.node_url, endpoint)
+        body = None if data is None else orjson.dumps(data)
         
         for attempt in range(self.max_retries + 1):
             try:
@@ -93,9 +94,9 @@ class BlockchainClient:
                 if method.upper() == 'GET':
                     response = self.session.get(url, params=params, timeout=self.timeout)
                 elif method.upper() == 'POST':
-                    response = self.session.post(url, json=data, timeout=self.timeout)
+                    response = self.session.post(url, data=body, timeout=self.timeout)
                 elif method.upper() == 'PUT':
-                    response = self.session.put(url, json=data, timeout=self.timeout)
+                    response = self.session.put(url, data=body, timeout=self.timeout)
                 elif method.upper() == 'DELETE':
                     response = self.session.delete(url, timeout=self.timeout)
                 else:
@@ -109,8 +110,8 @@ class BlockchainClient:
                 if response.status_code == 200:
                     self.connection_errors = 0
                     try:
-                        return response.json()
-                    except json.JSONDecodeError:
+                        return orjson.loads(response.content)
+                    except orjson.JSONDecodeError:
                         self.logger.error(f"Invalid JSON response from {url}")
                         return None
                 else:
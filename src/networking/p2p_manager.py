@@ -7,8 +7,9 @@ import threading
 import time
 import logging
 import json
-from typing import Dict, Any, List, Optional, Set, Callable
+from typing import Dict, Any, List, Optional, Set, Callable, Tuple
 from datetime import datetime
+from collections import namedtuple
 from concurrent.futures import ThreadPoolExecutor
 
 # Import networking components
@@ -21,6 +22,9 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from config.constants import DEFAULT_PORT, MAX_CONNECTIONS
 
+# Frozen view of the fields polled by the network status endpoint
+NetworkStatus = namedtuple('NetworkStatus', 'connected total running node_id port')
+
 
 class P2PManager:
     """
@@ -42,6 +46,8 @@ class P2PManager:
         self.peers = {}  # node_id -> peer_info
         self.connected_peers = set()
         self.blacklisted_peers = set()
+        self._peers_snapshot = ()  # immutable copy of connected_peers, rebuilt on change
+        self.status_snapshot = NetworkStatus(0, 0, False, self.node_id, self.port)
         
         # Network components
         self.client = BlockchainClient()
@@ -80,6 +86,7 @@ class P2PManager:
         try:
             self.is_running = True
             self.stats['start_time'] = time.time()
+            self._refresh_snapshots()
             
             # Initialize discovery with seed nodes
             if seed_nodes:
@@ -96,6 +103,7 @@ class P2PManager:
         except Exception as e:
             self.logger.error(f"Error starting P2P manager: {str(e)}")
             self.is_running = False
+            self._refresh_snapshots()
             raise
     
     def stop(self):
@@ -105,6 +113,7 @@ class P2PManager:
         
         try:
             self.is_running = False
+            self._refresh_snapshots()
             
             # Stop discovery
             self.discovery.stop_discovery()
@@ -217,6 +226,7 @@ class P2PManager:
                         
                         self.peers[node_id] = peer_info
                         self.connected_peers.add(node_id)
+                        self._refresh_snapshots()
                         
                         # Register ourselves with the peer
                         self.client.register_node(f"http://{self.host}:{self.port}")
@@ -243,6 +253,7 @@ class P2PManager:
                 peer_info = self.peers.get(node_id)
                 
                 self.connected_peers.remove(node_id)
+                self._refresh_snapshots()
                 
                 if peer_info:
                     # Call callback
@@ -255,6 +266,12 @@ class P2PManager:
         except Exception as e:
             self.logger.error(f"Error disconnecting from peer {node_id}: {str(e)}")
     
+    def _refresh_snapshots(self):
+        """Rebuild the peer and status snapshots after a peer or run-state change."""
+        self._peers_snapshot = tuple(self.connected_peers)
+        self.status_snapshot = NetworkStatus(len(self._peers_snapshot), len(self.peers),
+                                             self.is_running, self.node_id, self.port)
+    
     def _disconnect_all_peers(self):
         """Disconnect from all peers."""
         for node_id in list(self.connected_peers):
@@ -276,6 +293,9 @@ class P2PManager:
             self._disconnect_from_peer(node_id)
             if node_id in self.peers:
                 del self.peers[node_id]
+        
+        if dead_peers:
+            self._refresh_snapshots()
     
     def _send_heartbeat_to_peers(self):
         """Send heartbeat to all connected peers."""
@@ -431,7 +451,11 @@ class P2PManager:
     
     def get_connected_peers(self) -> List[str]:
         """Get list of connected peer IDs."""
-        return list(self.connected_peers)
+        return list(self._peers_snapshot)
+    
+    def get_peers_snapshot(self) -> Tuple[str, ...]:
+        """Get connected peer IDs as a shared tuple; no copy is made."""
+        return self._peers_snapshot
     
     def blacklist_peer(self, node_id: str, reason: str = None):
         """Blacklist a peer."""
@@ -3,14 +3,15 @@ BlockchainServer for BlockyHomework blockchain system.
 HTTP server implementation with Flask/FastAPI.
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, request
 from flask_cors import CORS
 import threading
 import time
 import logging
-from typing import Dict, Any, Optional, List
-import json
+from typing import Dict, Any, Optional, List, Tuple
+import orjson
 from datetime import datetime
+from collections import OrderedDict
 
 # Import constants and models
 import sys
@@ -22,6 +23,8 @@ from src.models.blockchain import Blockchain
 from src.models.transaction import Transaction
 from src.models.wallet import Wallet
 
+logger = logging.getLogger(__name__)
+
 
 class BlockchainServer:
     """
@@ -29,6 +32,46 @@ class BlockchainServer:
     Provides REST API endpoints for blockchain operations.
     """
     
+    # (path, method, handler name) for every API endpoint
+    ROUTES = (
+        # Blockchain endpoints
+        ('/api/blockchain/status', 'GET', 'get_blockchain_status'),
+        ('/api/chain', 'GET', 'get_full_chain'),
+        ('/api/chain/validate', 'GET', 'validate_chain'),
+        
+        # Transaction endpoints
+        ('/api/transactions/create', 'POST', 'create_transaction'),
+        ('/api/transactions/pending', 'GET', 'get_pending_transactions'),
+        ('/api/transactions/history', 'GET', 'get_transaction_history'),
+        
+        # Mining endpoints
+        ('/api/mining/status', 'GET', 'get_mining_status'),
+        ('/api/mining/start', 'POST', 'start_mining'),
+        ('/api/mining/stop', 'POST', 'stop_mining'),
+        ('/api/mining/mine-block', 'POST', 'mine_block'),
+        
+        # Wallet endpoints
+        ('/api/wallet/balance', 'GET', 'get_wallet_balance'),
+        ('/api/wallet/create', 'POST', 'create_wallet'),
+        
+        # Network endpoints
+        ('/api/network/status', 'GET', 'get_network_status'),
+        ('/api/nodes/register', 'POST', 'register_node'),
+        ('/api/nodes/list', 'GET', 'get_nodes'),
+        ('/api/consensus', 'GET', 'consensus_resolve'),
+        
+        # Health check
+        ('/api/health', 'GET', 'health_check'),
+        
+        # Information endpoints
+        ('/api/info', 'GET', 'get_server_info'),
+    )
+    
+    # Per-client token bucket for the expensive chain endpoints
+    RATE_LIMITED_PATHS = frozenset(('/api/chain', '/api/chain/validate'))
+    RATE_LIMIT = 10  # requests per second
+    RATE_BURST = 20
+    
     def __init__(self, host: str = "localhost", port: int = DEFAULT_PORT, 
                  blockchain: Blockchain = None):
         """Initialize the blockchain server."""
@@ -40,14 +83,26 @@ class BlockchainServer:
         self.app = Flask(__name__)
         CORS(self.app)  # Enable CORS for all domains
         
-        # Configure logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
-        
         # Server state
         self.is_running = False
         self.server_thread = None
         self.connected_nodes = set()
+        self._node_list: Tuple[str, ...] = ()  # rebuilt only when a node registers
+        self._nodes_lock = threading.Lock()
+        
+        # Set whenever the background miner has something to do
+        self._mining_wakeup = threading.Event()
+        
+        # Rate limiter state: client address -> [tokens, last refill time], least recently used first
+        self._rate_limits: Dict[str, List[float]] = OrderedDict()
+        self._rate_limits_lock = threading.Lock()
+        
+        # Status snapshot shared by the polling endpoints
+        self._status_snapshot: Dict[str, Any] = {}
+        self._status_snapshot_ts = 0.0
+        
+        # Pre-serialized response bodies for the hot health/info endpoints
+        self._build_response_templates()
         
         # Setup routes
         self._setup_routes()
@@ -55,97 +110,80 @@ class BlockchainServer:
     
     def _setup_routes(self):
         """Setup all API routes."""
+        for path, method, name in self.ROUTES:
+            self.app.add_url_rule(path, endpoint=name,
+                                  view_func=getattr(self, name), methods=[method])
         
-        # Blockchain endpoints
-        self.app.route('/api/blockchain/status', methods=['GET'])(self.get_blockchain_status)
-        self.app.route('/api/chain', methods=['GET'])(self.get_full_chain)
-        self.app.route('/api/chain/validate', methods=['GET'])(self.validate_chain)
-        
-        # Transaction endpoints
-        self.app.route('/api/transactions/create', methods=['POST'])(self.create_transaction)
-        self.app.route('/api/transactions/pending', methods=['GET'])(self.get_pending_transactions)
-        self.app.route('/api/transactions/history', methods=['GET'])(self.get_transaction_history)
-        
-        # Mining endpoints
-        self.app.route('/api/mining/status', methods=['GET'])(self.get_mining_status)
-        self.app.route('/api/mining/start', methods=['POST'])(self.start_mining)
-        self.app.route('/api/mining/stop', methods=['POST'])(self.stop_mining)
-        self.app.route('/api/mining/mine-block', methods=['POST'])(self.mine_block)
-        
-        # Wallet endpoints
-        self.app.route('/api/wallet/balance', methods=['GET'])(self.get_wallet_balance)
-        self.app.route('/api/wallet/create', methods=['POST'])(self.create_wallet)
-        
-        # Network endpoints
-        self.app.route('/api/network/status', methods=['GET'])(self.get_network_status)
-        self.app.route('/api/nodes/register', methods=['POST'])(self.register_node)
-        self.app.route('/api/nodes/list', methods=['GET'])(self.get_nodes)
-        self.app.route('/api/consensus', methods=['GET'])(self.consensus_resolve)
-        
-        # Health check
-        self.app.route('/api/health', methods=['GET'])(self.health_check)
-        
-        # Information endpoints
-        self.app.route('/api/info', methods=['GET'])(self.get_server_info)
+        self.app.before_request(self._enforce_rate_limit)
     
     def _setup_error_handlers(self):
         """Setup error handling middleware."""
         
         @self.app.errorhandler(400)
         def bad_request(error):
-            return jsonify({
+            return self._json({
                 'error': 'Bad Request',
                 'message': 'Invalid request format or parameters',
                 'status': 400,
                 'timestamp': datetime.now().isoformat()
-            }), 400
+            }, 400)
         
         @self.app.errorhandler(404)
         def not_found(error):
-            return jsonify({
+            return self._json({
                 'error': 'Not Found',
                 'message': 'The requested resource was not found',
                 'status': 404,
                 'timestamp': datetime.now().isoformat()
-            }), 404
+            }, 404)
         
         @self.app.errorhandler(500)
         def internal_error(error):
-            return jsonify({
+            return self._json({
                 'error': 'Internal Server Error',
                 'message': 'An internal server error occurred',
                 'status': 500,
                 'timestamp': datetime.now().isoformat()
-            }), 500
+            }, 500)
     
     # API Endpoint Implementations
     
     def get_blockchain_status(self):
         """Get current blockchain status."""
         try:
-            return jsonify({
+            snapshot = self._snapshot()
+            return self._json({
                 'success': True,
                 'data': {
-                    'chain_length': self.blockchain.get_chain_length(),
+                    'chain_length': snapshot['chain_length'],
                     'latest_block': self.blockchain.get_latest_block().to_dict(),
-                    'difficulty': self.blockchain.difficulty,
-                    'mempool_size': self.blockchain.mempool.get_transaction_count(),
-                    'is_valid': self.blockchain.validate_chain()
+                    'difficulty': snapshot['difficulty'],
+                    'mempool_size': snapshot['mempool_size'],
+                    'is_valid': self.blockchain.is_chain_valid()
                 },
                 'timestamp': datetime.now().isoformat()
             })
         except Exception as e:
-            self.logger.error(f"Error getting blockchain status: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error getting blockchain status: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def get_full_chain(self):
         """Get the complete blockchain."""
         try:
+            # The tip hash alone misses edits below the tip; the transaction edit
+            # counter covers those, and the incremental validity check stays cheap
+            etag = (f"{self.blockchain.get_chain_length()}-"
+                    f"{int(self.blockchain.is_chain_valid())}-"
+                    f"{Transaction.edit_count}-"
+                    f"{self.blockchain.get_latest_block().hash}")
+            if etag in request.if_none_match:
+                return self._with_cache_headers(self.app.response_class(status=304), etag)
+            
             chain_data = []
             for block in self.blockchain.chain:
                 chain_data.append(block.to_dict())
             
-            return jsonify({
+            response = self._json({
                 'success': True,
                 'data': {
                     'chain': chain_data,
@@ -153,15 +191,17 @@ class BlockchainServer:
                 },
                 'timestamp': datetime.now().isoformat()
             })
+            return self._with_cache_headers(response, etag)
         except Exception as e:
-            self.logger.error(f"Error getting full chain: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error getting full chain: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def validate_chain(self):
         """Validate the blockchain."""
         try:
+            # Always re-checked: validity can change without the tip moving
             is_valid = self.blockchain.validate_chain()
-            return jsonify({
+            return self._json({
                 'success': True,
                 'data': {
                     'is_valid': is_valid,
@@ -170,19 +210,19 @@ class BlockchainServer:
                 'timestamp': datetime.now().isoformat()
             })
         except Exception as e:
-            self.logger.error(f"Error validating chain: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error validating chain: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def create_transaction(self):
         """Create a new transaction."""
         try:
-            data = request.get_json()
+            data = self._read_json()
             
-            if not data or 'sender' not in data or 'recipient' not in data or 'amount' not in data:
-                return jsonify({
+            if not isinstance(data, dict) or not data.keys() >= {'sender', 'recipient', 'amount'}:
+                return self._json({
                     'success': False,
                     'error': 'Missing required fields: sender, recipient, amount'
-                }), 400
+                }, 400)
             
             # Create transaction
             transaction = Transaction(
@@ -195,7 +235,8 @@ class BlockchainServer:
             success = self.blockchain.add_transaction(transaction)
             
             if success:
-                return jsonify({
+                self._mining_wakeup.set()
+                return self._json({
                     'success': True,
                     'data': {
                         'transaction': transaction.to_dict(),
@@ -204,14 +245,14 @@ class BlockchainServer:
                     'timestamp': datetime.now().isoformat()
                 })
             else:
-                return jsonify({
+                return self._json({
                     'success': False,
                     'error': 'Failed to add transaction to mempool'
-                }), 400
+                }, 400)
                 
         except Exception as e:
-            self.logger.error(f"Error creating transaction: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error creating transaction: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def get_pending_transactions(self):
         """Get pending transactions from mempool."""
@@ -219,7 +260,7 @@ class BlockchainServer:
             pending = self.blockchain.mempool.get_pending_transactions()
             transactions_data = [tx.to_dict() for tx in pending]
             
-            return jsonify({
+            return self._json({
                 'success': True,
                 'data': {
                     'transactions': transactions_data,
@@ -228,18 +269,18 @@ class BlockchainServer:
                 'timestamp': datetime.now().isoformat()
             })
         except Exception as e:
-            self.logger.error(f"Error getting pending transactions: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error getting pending transactions: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def get_transaction_history(self):
         """Get transaction history."""
         try:
             address = request.args.get('address')
             if not address:
-                return jsonify({
+                return self._json({
                     'success': False,
                     'error': 'Address parameter required'
-                }), 400
+                }, 400)
             
             # Get transactions from all blocks
             transactions = []
@@ -248,7 +289,7 @@ class BlockchainServer:
                     if tx.sender == address or tx.recipient == address:
                         transactions.append(tx.to_dict())
             
-            return jsonify({
+            return self._json({
                 'success': True,
                 'data': {
                     'transactions': transactions,
@@ -257,41 +298,42 @@ class BlockchainServer:
                 'timestamp': datetime.now().isoformat()
             })
         except Exception as e:
-            self.logger.error(f"Error getting transaction history: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error getting transaction history: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def get_mining_status(self):
         """Get current mining status."""
         try:
-            return jsonify({
+            snapshot = self._snapshot()
+            return self._json({
                 'success': True,
                 'data': {
                     'is_mining': hasattr(self, '_mining_thread') and self._mining_thread and self._mining_thread.is_alive(),
-                    'difficulty': self.blockchain.difficulty,
-                    'block_reward': self.blockchain.block_reward,
-                    'pending_transactions': self.blockchain.mempool.get_transaction_count()
+                    'difficulty': snapshot['difficulty'],
+                    'block_reward': snapshot['block_reward'],
+                    'pending_transactions': snapshot['mempool_size']
                 },
                 'timestamp': datetime.now().isoformat()
             })
         except Exception as e:
-            self.logger.error(f"Error getting mining status: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error getting mining status: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def start_mining(self):
         """Start mining process."""
         try:
             if hasattr(self, '_mining_thread') and self._mining_thread and self._mining_thread.is_alive():
-                return jsonify({
+                return self._json({
                     'success': False,
                     'error': 'Mining already in progress'
-                }), 400
+                }, 400)
             
             # Start mining in background thread
             self._mining_thread = threading.Thread(target=self._mine_continuously)
             self._mining_active = True
             self._mining_thread.start()
             
-            return jsonify({
+            return self._json({
                 'success': True,
                 'data': {
                     'message': 'Mining started successfully',
@@ -300,23 +342,24 @@ class BlockchainServer:
                 'timestamp': datetime.now().isoformat()
             })
         except Exception as e:
-            self.logger.error(f"Error starting mining: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error starting mining: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def stop_mining(self):
         """Stop mining process."""
         try:
             if not hasattr(self, '_mining_thread') or not self._mining_thread or not self._mining_thread.is_alive():
-                return jsonify({
+                return self._json({
                     'success': False,
                     'error': 'Mining is not currently active'
-                }), 400
+                }, 400)
             
             self._mining_active = False
+            self._mining_wakeup.set()
             if self._mining_thread:
                 self._mining_thread.join(timeout=5)
             
-            return jsonify({
+            return self._json({
                 'success': True,
                 'data': {
                     'message': 'Mining stopped successfully',
@@ -325,24 +368,24 @@ class BlockchainServer:
                 'timestamp': datetime.now().isoformat()
             })
         except Exception as e:
-            self.logger.error(f"Error stopping mining: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error stopping mining: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def mine_block(self):
         """Mine a single block."""
         try:
             # Check if there are pending transactions
             if self.blockchain.mempool.get_transaction_count() == 0:
-                return jsonify({
+                return self._json({
                     'success': False,
                     'error': 'No pending transactions to mine'
-                }), 400
+                }, 400)
             
             # Mine the block
             new_block = self.blockchain.mine_block("miner_address")
             
             if new_block:
-                return jsonify({
+                return self._json({
                     'success': True,
                     'data': {
                         'block': new_block.to_dict(),
@@ -351,28 +394,28 @@ class BlockchainServer:
                     'timestamp': datetime.now().isoformat()
                 })
             else:
-                return jsonify({
+                return self._json({
                     'success': False,
                     'error': 'Failed to mine block'
-                }), 500
+                }, 500)
                 
         except Exception as e:
-            self.logger.error(f"Error mining block: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error mining block: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def get_wallet_balance(self):
         """Get wallet balance."""
         try:
             address = request.args.get('address')
             if not address:
-                return jsonify({
+                return self._json({
                     'success': False,
                     'error': 'Address parameter required'
-                }), 400
+                }, 400)
             
             balance = self.blockchain.get_balance(address)
             
-            return jsonify({
+            return self._json({
                 'success': True,
                 'data': {
                     'address': address,
@@ -381,15 +424,15 @@ class BlockchainServer:
                 'timestamp': datetime.now().isoformat()
             })
         except Exception as e:
-            self.logger.error(f"Error getting wallet balance: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error getting wallet balance: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def create_wallet(self):
         """Create a new wallet."""
         try:
             wallet = Wallet()
             
-            return jsonify({
+            return self._json({
                 'success': True,
                 'data': {
                     'wallet': wallet.to_dict(),
@@ -398,42 +441,49 @@ class BlockchainServer:
                 'timestamp': datetime.now().isoformat()
             })
         except Exception as e:
-            self.logger.error(f"Error creating wallet: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error creating wallet: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def get_network_status(self):
         """Get network status."""
         try:
-            return jsonify({
+            snapshot = self._snapshot()
+            data = {
+                'node_count': len(self.connected_nodes),
+                'server_host': self.host,
+                'server_port': self.port,
+                'uptime': snapshot['uptime']
+            }
+            if request.args.get('include_nodes', '1') != '0':
+                data['connected_nodes'] = self._node_list
+            
+            return self._json({
                 'success': True,
-                'data': {
-                    'connected_nodes': list(self.connected_nodes),
-                    'node_count': len(self.connected_nodes),
-                    'server_host': self.host,
-                    'server_port': self.port,
-                    'uptime': time.time() - getattr(self, 'start_time', time.time())
-                },
+                'data': data,
                 'timestamp': datetime.now().isoformat()
             })
         except Exception as e:
-            self.logger.error(f"Error getting network status: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error getting network status: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def register_node(self):
         """Register a new node."""
         try:
-            data = request.get_json()
+            data = self._read_json()
             
-            if not data or 'node_url' not in data:
-                return jsonify({
+            if not isinstance(data, dict) or 'node_url' not in data:
+                return self._json({
                     'success': False,
                     'error': 'Missing required field: node_url'
-                }), 400
+                }, 400)
             
             node_url = data['node_url']
-            self.connected_nodes.add(node_url)
+            with self._nodes_lock:
+                if node_url not in self.connected_nodes:
+                    self.connected_nodes.add(node_url)
+                    self._node_list = tuple(self.connected_nodes)
             
-            return jsonify({
+            return self._json({
                 'success': True,
                 'data': {
                     'node_url': node_url,
@@ -443,29 +493,29 @@ class BlockchainServer:
                 'timestamp': datetime.now().isoformat()
             })
         except Exception as e:
-            self.logger.error(f"Error registering node: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error registering node: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def get_nodes(self):
         """Get list of connected nodes."""
         try:
-            return jsonify({
+            return self._json({
                 'success': True,
                 'data': {
-                    'nodes': list(self.connected_nodes),
-                    'count': len(self.connected_nodes)
+                    'nodes': self._node_list,
+                    'count': len(self._node_list)
                 },
                 'timestamp': datetime.now().isoformat()
             })
         except Exception as e:
-            self.logger.error(f"Error getting nodes: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error getting nodes: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def consensus_resolve(self):
         """Resolve conflicts using consensus algorithm."""
         try:
             # TODO: Implement consensus resolution with other nodes
-            return jsonify({
+            return self._json({
                 'success': True,
                 'data': {
                     'message': 'Consensus resolved',
@@ -475,65 +525,138 @@ class BlockchainServer:
                 'timestamp': datetime.now().isoformat()
             })
         except Exception as e:
-            self.logger.error(f"Error resolving consensus: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error resolving consensus: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def health_check(self):
         """Health check endpoint."""
         try:
-            return jsonify({
-                'success': True,
-                'data': {
-                    'status': 'healthy',
-                    'server': 'BlockyHomework Blockchain Server',
-                    'version': '1.0.0',
-                    'uptime': time.time() - getattr(self, 'start_time', time.time())
-                },
-                'timestamp': datetime.now().isoformat()
-            })
+            snapshot = self._snapshot()
+            body = self._health_template % (
+                orjson.dumps(snapshot['uptime']),
+                datetime.now().isoformat().encode()
+            )
+            return self.app.response_class(body, mimetype='application/json')
         except Exception as e:
-            self.logger.error(f"Error in health check: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error in health check: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     def get_server_info(self):
         """Get server information."""
         try:
-            return jsonify({
-                'success': True,
-                'data': {
-                    'server_name': 'BlockyHomework Blockchain Server',
-                    'version': '1.0.0',
-                    'host': self.host,
-                    'port': self.port,
-                    'blockchain': {
-                        'chain_length': self.blockchain.get_chain_length(),
-                        'difficulty': self.blockchain.difficulty,
-                        'block_reward': self.blockchain.block_reward
-                    },
-                    'network': {
-                        'connected_nodes': len(self.connected_nodes),
-                        'uptime': time.time() - getattr(self, 'start_time', time.time())
-                    }
-                },
-                'timestamp': datetime.now().isoformat()
-            })
+            snapshot = self._snapshot()
+            body = self._info_template % (
+                orjson.dumps(snapshot['chain_length']),
+                orjson.dumps(snapshot['difficulty']),
+                orjson.dumps(snapshot['block_reward']),
+                orjson.dumps(len(self.connected_nodes)),
+                orjson.dumps(snapshot['uptime']),
+                datetime.now().isoformat().encode()
+            )
+            return self.app.response_class(body, mimetype='application/json')
         except Exception as e:
-            self.logger.error(f"Error getting server info: {str(e)}")
-            return jsonify({'success': False, 'error': str(e)}), 500
+            logger.exception("Error getting server info: %s", e)
+            return self._json({'success': False, 'error': str(e)}, 500)
     
     # Helper Methods
     
+    def _json(self, payload: Any, status: int = 200):
+        """Build a JSON response encoded with orjson."""
+        return self.app.response_class(orjson.dumps(payload), status=status,
+                                       mimetype='application/json')
+    
+    def _enforce_rate_limit(self):
+        """Reject clients polling the chain endpoints faster than RATE_LIMIT."""
+        if request.path in self.RATE_LIMITED_PATHS and not self._allow_request(request.remote_addr):
+            return self._json({'success': False, 'error': 'Too many requests'}, 429)
+        return None
+    
+    def _allow_request(self, client: str) -> bool:
+        """Take one token from the client's bucket, refilling it by elapsed time."""
+        now = time.monotonic()
+        refill_time = self.RATE_BURST / self.RATE_LIMIT
+        with self._rate_limits_lock:
+            buckets = self._rate_limits
+            # A bucket idle long enough to refill is the same as a new one, so drop it
+            while buckets and now - next(iter(buckets.values()))[1] >= refill_time:
+                buckets.popitem(last=False)
+            
+            bucket = buckets.get(client)
+            if bucket is None:
+                bucket = buckets[client] = [float(self.RATE_BURST), now]
+            else:
+                buckets.move_to_end(client)
+                bucket[0] = min(self.RATE_BURST, bucket[0] + (now - bucket[1]) * self.RATE_LIMIT)
+                bucket[1] = now
+            
+            if bucket[0] < 1:
+                return False
+            bucket[0] -= 1
+            return True
+    
+    def _read_json(self) -> Any:
+        """Decode the request body with orjson, returning None if it is not valid JSON."""
+        try:
+            return orjson.loads(request.get_data(cache=False))
+        except orjson.JSONDecodeError:
+            return None
+    
+    def _build_response_templates(self):
+        """Serialize the constant parts of /api/health and /api/info once."""
+        def fragment(value) -> bytes:
+            return orjson.dumps(value).replace(b'%', b'%%')
+        
+        server_name = fragment('BlockyHomework Blockchain Server')
+        version = fragment('1.0.0')
+        
+        self._health_template = (
+            b'{"success":true,"data":{"status":"healthy","server":' + server_name +
+            b',"version":' + version + b',"uptime":%s},"timestamp":"%s"}'
+        )
+        self._info_template = (
+            b'{"success":true,"data":{"server_name":' + server_name +
+            b',"version":' + version +
+            b',"host":' + fragment(self.host) +
+            b',"port":' + fragment(self.port) +
+            b',"blockchain":{"chain_length":%s,"difficulty":%s,"block_reward":%s}'
+            b',"network":{"connected_nodes":%s,"uptime":%s}},"timestamp":"%s"}'
+        )
+    
+    def _snapshot(self) -> Dict[str, Any]:
+        """Return blockchain status values, recomputed at most every 100 ms."""
+        now = time.time()
+        if now - self._status_snapshot_ts > 0.1:
+            self._status_snapshot = {
+                'chain_length': self.blockchain.get_chain_length(),
+                'difficulty': self.blockchain.difficulty,
+                'block_reward': self.blockchain.block_reward,
+                'mempool_size': self.blockchain.mempool.get_transaction_count(),
+                'uptime': now - getattr(self, 'start_time', now)
+            }
+            self._status_snapshot_ts = now
+        return self._status_snapshot
+    
+    def _with_cache_headers(self, response, etag: str):
+        """Tag a chain response with its ETag so clients can revalidate cheaply."""
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'public, max-age=1'
+        return response
+    
     def _mine_continuously(self):
         """Continuously mine blocks in background."""
         while getattr(self, '_mining_active', False):
             try:
+                # Clear before checking the mempool so a transaction arriving
+                # in between still wakes the wait below immediately
+                self._mining_wakeup.clear()
                 if self.blockchain.mempool.get_transaction_count() > 0:
                     self.blockchain.mine_block("miner_address")
-                    self.logger.info("New block mined successfully")
+                    logger.info("New block mined successfully")
                 else:
-                    time.sleep(1)
+                    # Timeout covers transactions added to the mempool directly
+                    self._mining_wakeup.wait(timeout=1)
             except Exception as e:
-                self.logger.error(f"Error in continuous mining: {str(e)}")
+                logger.exception("Error in continuous mining: %s", e)
                 time.sleep(1)
     
     def start_server(self, debug: bool = False, threaded: bool = True):
@@ -542,7 +665,7 @@ class BlockchainServer:
             self.start_time = time.time()
             self.is_running = True
             
-            self.logger.info(f"Starting BlockyHomework Blockchain Server on {self.host}:{self.port}")
+            logger.info("Starting BlockyHomework Blockchain Server on %s:%s", self.host, self.port)
             
             self.app.run(
                 host=self.host,
@@ -553,7 +676,7 @@ class BlockchainServer:
             )
             
         except Exception as e:
-            self.logger.error(f"Error starting server: {str(e)}")
+            logger.exception("Error starting server: %s", e)
             self.is_running = False
             raise
     
@@ -565,14 +688,15 @@ class BlockchainServer:
             # Stop mining if active
             if hasattr(self, '_mining_active'):
                 self._mining_active = False
+                self._mining_wakeup.set()
             
             if hasattr(self, '_mining_thread') and self._mining_thread:
                 self._mining_thread.join(timeout=5)
             
-            self.logger.info("BlockyHomework Blockchain Server stopped")
+            logger.info("BlockyHomework Blockchain Server stopped")
             
         except Exception as e:
-            self.logger.error(f"Error stopping server: {str(e)}")
+            logger.exception("Error stopping server: %s", e)
             raise
     
     def get_status(self) -> Dict[str, Any]:
@@ -599,6 +723,8 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO)
+    
     # Create and start server
     server = BlockchainServer(host=args.host, port=args.port)
     
@@ -3,12 +3,20 @@ AttackSimulator for BlockyHomework blockchain system.
 51% attack simulation implementation.
 """
 
+import atexit
+import os
 import time
-import random
+import multiprocessing
 import threading
-from typing import Dict, List, Any, Optional, Callable
+import queue
+from typing import Dict, List, Any, Optional, Callable, Iterator, Tuple
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 import json
+import pickle
+from collections import deque, namedtuple
+
+import numpy as np
 
 from models.blockchain import Blockchain
 from models.block import Block
@@ -16,16 +24,152 @@ from models.transaction import Transaction
 from models.wallet import Wallet
 
 
+# Frozen view of the fields polled by the simulation status endpoint
+SimulationStatus = namedtuple('SimulationStatus', 'is_running current_scenario attack_progress')
+
+
+# Proof-of-work workers shared by every simulator, started on first use
+_MINING_POOL = None
+_MINING_POOL_LOCK = threading.Lock()
+# Set in processes that are themselves workers, which mine on their own process instead
+_INLINE_MINING = False
+
+
+def _shared_mining_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Return the long-lived mining pool, creating it on first call.
+    
+    Workers are spawned rather than forked, since the pool is first needed on
+    a simulation thread, possibly inside a threaded server. Returns None in
+    processes set up with use_inline_mining().
+    """
+    global _MINING_POOL
+    if _INLINE_MINING:
+        return None
+    with _MINING_POOL_LOCK:
+        if _MINING_POOL is None:
+            _MINING_POOL = ProcessPoolExecutor(
+                max_workers=2, mp_context=multiprocessing.get_context('spawn')
+            )
+        return _MINING_POOL
+
+
+def use_inline_mining():
+    """Mine proof-of-work on this process rather than a nested pool; for worker processes."""
+    global _INLINE_MINING
+    _INLINE_MINING = True
+
+
+def _shutdown_mining_pool():
+    """Stop the mining pool's workers at interpreter exit."""
+    global _MINING_POOL
+    with _MINING_POOL_LOCK:
+        pool, _MINING_POOL = _MINING_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _forget_mining_pool():
+    """Drop the parent's pool in a forked child, whose copy has no live management thread."""
+    global _MINING_POOL, _MINING_POOL_LOCK
+    _MINING_POOL = None
+    _MINING_POOL_LOCK = threading.Lock()
+
+
+atexit.register(_shutdown_mining_pool)
+os.register_at_fork(after_in_child=_forget_mining_pool)
+
+
+def _solve_block(template: Dict[str, Any], difficulty: int) -> Tuple[int, str]:
+    """
+    Find the proof of work for a serialized block template in a worker process.
+    
+    Only the template crosses the process boundary; the caller applies the
+    returned proof and hash to its own block and appends it.
+    """
+    block = Block.from_dict(template)
+    # from_dict stamps the current time; the hash must cover the template's
+    block.timestamp = template['timestamp']
+    proof = block.mine_proof_of_work(difficulty)
+    return proof, block.hash
+
+
+def run_attack_trials(n_ticks: int, p_attack: float, p_legitimate: float,
+                      p_legitimate_after_attack: float, trials: int,
+                      rng: np.random.Generator, withhold_ticks: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Monte-Carlo the per-tick block race of an attack scenario without mining.
+    
+    Each tick the attacker finds a block with probability ``p_attack``. On the
+    remaining ticks the legitimate network finds one with ``p_legitimate``,
+    and after an attacker block it may still find one with
+    ``p_legitimate_after_attack``. ``n_ticks`` is the time budget in ticks;
+    an attacker block that is withheld costs ``withhold_ticks`` more, so fewer
+    ticks fit into the budget. Without withholding, the per-tick draws are
+    independent and the counts are drawn directly from their binomial
+    distributions.
+    
+    Returns:
+        Tuple of arrays (attack_blocks, legitimate_blocks), one entry per trial
+    """
+    if withhold_ticks:
+        # A tick runs while the time spent before it is still within the budget
+        attack = rng.random((trials, n_ticks)) < p_attack
+        cost = 1 + withhold_ticks * attack
+        started = np.cumsum(cost, axis=1) - cost < n_ticks
+        ticks = started.sum(axis=1)
+        attack_blocks = (attack & started).sum(axis=1)
+    else:
+        ticks = n_ticks
+        attack_blocks = rng.binomial(n_ticks, p_attack, size=trials)
+    legitimate_blocks = (
+        rng.binomial(ticks - attack_blocks, p_legitimate) +
+        rng.binomial(attack_blocks, p_legitimate_after_attack)
+    )
+    return attack_blocks, legitimate_blocks
+
+
 class AttackSimulator:
     """
     Simulates various blockchain attacks for educational purposes.
     Supports 51% attacks, double-spending, selfish mining, and eclipse attacks.
     """
     
+    # Instance attributes; no per-instance __dict__
+    __slots__ = (
+        'is_running', 'current_scenario', 'attack_progress', 'status_snapshot', 'simulation_thread',
+        'attack_type', 'attack_power', 'attack_duration', 'network_size', 'tick_interval',
+        '_stop_event', '_done_event', '_rng', '_mining_pool', '_metrics_queue', '_metrics_thread',
+        'legitimate_chain', 'attack_chain', 'attack_wallet',
+        '_legitimate_recent', '_attack_recent', 'metrics',
+        'on_progress_update', 'on_attack_complete', 'on_metrics_update'
+    )
+    
+    # Attack scenarios: attack type -> (attacker block probability, None for the
+    # configured attack power; legitimate block probability on other ticks;
+    # legitimate block probability after a withheld attacker block; warm-up
+    # legitimate blocks; setup method name; wrap-up method name)
+    SCENARIOS = {
+        '51_percent': (None, 1.0, 0.0, 5, None, '_evaluate_attack_success'),
+        'double_spend': (0.7, 1.0, 0.0, 3, '_prepare_double_spend', '_evaluate_double_spend'),
+        'selfish_mining': (None, 1.0, 0.3, 3, None, None),
+        'eclipse': (None, 0.3, 0.0, 3, None, None)
+    }
+    
+    # Legitimate blocks a scenario setup method mines before the race starts
+    SETUP_LEGITIMATE_BLOCKS = {'_prepare_double_spend': 1}
+    
+    # Extra ticks the race waits after a withheld attacker block
+    WITHHOLD_TICKS = 2
+    
+    # Ticks between metrics snapshots published from a scenario loop
+    METRICS_PUBLISH_TICKS = 16
+    
     def __init__(self):
         self.is_running = False
         self.current_scenario = None
         self.attack_progress = 0
+        self.status_snapshot = SimulationStatus(False, None, 0)
         self.simulation_thread = None
         
         # Attack configuration
@@ -33,12 +177,31 @@ class AttackSimulator:
         self.attack_power = 51  # Percentage of network hashpower
         self.attack_duration = 10  # Minutes
         self.network_size = 100  # Number of nodes
+        self.tick_interval = 1.0  # Seconds of wall time per simulation tick
+        
+        # Wakes tick waits early when the simulation is stopped
+        self._stop_event = threading.Event()
+        # Set whenever no simulation thread is running
+        self._done_event = threading.Event()
+        self._done_event.set()
+        self._rng = np.random.default_rng()
+        
+        # Worker processes running proof-of-work while a simulation is active
+        self._mining_pool = None
+        
+        # Metrics snapshots handed to the callback thread; None ends the pump
+        self._metrics_queue = queue.Queue(maxsize=8)
+        self._metrics_thread = None
         
         # Simulation state
         self.legitimate_chain = Blockchain()
         self.attack_chain = Blockchain()
         self.attack_wallet = Wallet()
         
+        # Serialized tail of each chain, updated as blocks are mined
+        self._legitimate_recent = self._recent_blocks(self.legitimate_chain)
+        self._attack_recent = self._recent_blocks(self.attack_chain)
+        
         # Metrics
         self.metrics = {
             'attack_success': False,
@@ -54,14 +217,6 @@ class AttackSimulator:
         self.on_progress_update = None
         self.on_attack_complete = None
         self.on_metrics_update = None
-        
-        # Attack scenarios
-        self.scenarios = {
-            '51_percent': self._simulate_51_percent_attack,
-            'double_spend': self._simulate_double_spend,
-            'selfish_mining': self._simulate_selfish_mining,
-            'eclipse': self._simulate_eclipse_attack
-        }
     
     def start_simulation(self, scenario: str = "51_percent", 
                         attack_power: int = 51, 
@@ -90,8 +245,19 @@ class AttackSimulator:
         # Reset simulation state
         self._reset_simulation()
         
+        # Deliver metrics callbacks off the simulation thread
+        self._metrics_queue = queue.Queue(maxsize=8)
+        self._metrics_thread = threading.Thread(
+            target=self._metrics_pump,
+            args=(self._metrics_queue,),
+            daemon=True
+        )
+        self._metrics_thread.start()
+        
         # Start simulation thread
         self.is_running = True
+        self._refresh_status()
+        self._done_event.clear()
         self.simulation_thread = threading.Thread(
             target=self._run_simulation,
             daemon=True
@@ -105,12 +271,28 @@ class AttackSimulator:
         if not self.is_running:
             return False
         
+        self._stop_event.set()
         self.is_running = False
+        self._refresh_status()
         if self.simulation_thread:
             self.simulation_thread.join(timeout=5)
         
         return True
     
+    def _refresh_status(self):
+        """Publish a consistent status snapshot for lock-free readers."""
+        self.status_snapshot = SimulationStatus(self.is_running, self.current_scenario,
+                                                self.attack_progress)
+    
+    @property
+    def done_event(self) -> threading.Event:
+        """Set whenever no simulation is running; cleared on start."""
+        return self._done_event
+    
+    def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
+        """Block until the current simulation finishes; False if the timeout expired first."""
+        return self._done_event.wait(timeout)
+    
     def get_simulation_status(self) -> Dict[str, Any]:
         """Get current simulation status."""
         return {
@@ -127,26 +309,124 @@ class AttackSimulator:
         """Get attack simulation metrics."""
         return self.metrics.copy()
     
+    def run_batch(self, n_replicates: int, seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run independent replicates of the configured attack as a Monte-Carlo batch.
+        
+        Each replicate follows the per-tick block race of the simulation loop,
+        drawn with run_attack_trials instead of mining in real time; the draws
+        are vectorized, so no worker processes are needed. Like
+        preview_attack, it assumes every tick completes within ``tick_interval``.
+        
+        Args:
+            n_replicates: Number of simulations to run
+            seed: Optional seed making the batch reproducible
+            
+        Returns:
+            Dict with the success tally and the metrics of every replicate
+        """
+        attack_blocks, legitimate_blocks = self._draw_trials(n_replicates, np.random.default_rng(seed))
+        attack_success = attack_blocks > legitimate_blocks
+        network_impact = (attack_blocks + 1) / (attack_blocks + legitimate_blocks + 2) * 100
+        
+        results = [
+            {
+                'attack_success': success,
+                'blocks_mined_attack': attack,
+                'blocks_mined_legitimate': legitimate,
+                'network_impact': impact
+            }
+            for success, attack, legitimate, impact in zip(
+                attack_success.tolist(), attack_blocks.tolist(),
+                legitimate_blocks.tolist(), network_impact.tolist()
+            )
+        ]
+        
+        # _evaluate_double_spend succeeds when the attack chain ends up longer; both chains
+        # start from genesis, so that is the same block-count comparison
+        if self._scenario_profile()[5] == '_evaluate_double_spend':
+            for result in results:
+                result['double_spend_success'] = result['attack_success']
+        
+        successful = int(attack_success.sum())
+        return {
+            'replicates': n_replicates,
+            'successful_attacks': successful,
+            'success_rate': successful / max(1, n_replicates) * 100,
+            'results': results
+        }
+    
+    def preview_attack(self, trials: int = 1000) -> Dict[str, float]:
+        """
+        Estimate the outcome of the configured attack without mining any blocks.
+        
+        Assumes every tick of the attack completes within ``tick_interval``.
+        
+        Args:
+            trials: Number of Monte-Carlo replicates
+            
+        Returns:
+            Dict with mean block counts and the share of trials won by the attacker;
+            legitimate counts include the warm-up and setup blocks, as in run_batch
+        """
+        attack_blocks, legitimate_blocks = self._draw_trials(trials, self._rng)
+        
+        return {
+            'expected_blocks_attack': float(attack_blocks.mean()),
+            'expected_blocks_legitimate': float(legitimate_blocks.mean()),
+            'attack_win_probability': float((attack_blocks > legitimate_blocks).mean())
+        }
+    
+    def _draw_trials(self, trials: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Draw Monte-Carlo block counts for the configured attack, as _run_scenario races it.
+        
+        Both chains start from genesis; the legitimate counts include the
+        warm-up blocks and any block mined by the scenario's setup.
+        
+        Raises:
+            ValueError: If ``tick_interval`` is not positive
+        """
+        if self.tick_interval <= 0:
+            raise ValueError("tick_interval must be positive")
+        
+        (p_attack, p_legitimate, p_legitimate_after_attack,
+         warmup_blocks, setup, _) = self._scenario_profile()
+        n_ticks = int(self.attack_duration * 60 / self.tick_interval)
+        # _run_scenario withholds attacker blocks exactly when a catch-up chance is configured
+        attack_blocks, legitimate_blocks = run_attack_trials(
+            n_ticks, p_attack, p_legitimate, p_legitimate_after_attack,
+            trials=trials, rng=rng,
+            withhold_ticks=self.WITHHOLD_TICKS if p_legitimate_after_attack else 0
+        )
+        head_start = warmup_blocks + self.SETUP_LEGITIMATE_BLOCKS.get(setup, 0)
+        return attack_blocks, legitimate_blocks + head_start
+    
     def get_chain_comparison(self) -> Dict[str, Any]:
         """Get comparison between legitimate and attack chains."""
         return {
             'legitimate_chain': {
                 'length': len(self.legitimate_chain.chain),
-                'blocks': [block.to_dict() for block in self.legitimate_chain.chain[-5:]]
+                'blocks': list(self._legitimate_recent)
             },
             'attack_chain': {
                 'length': len(self.attack_chain.chain),
-                'blocks': [block.to_dict() for block in self.attack_chain.chain[-5:]]
+                'blocks': list(self._attack_recent)
             }
         }
     
     def _reset_simulation(self):
         """Reset simulation state."""
+        self._stop_event.clear()
         self.attack_progress = 0
         self.current_scenario = None
-        self.legitimate_chain = Blockchain()
-        self.attack_chain = Blockchain()
-        self.attack_wallet = Wallet()
+        self._refresh_status()
+        
+        # Reuse the existing chains and attacker keypair rather than rebuilding them
+        self.legitimate_chain.clear_to_genesis()
+        self.attack_chain.clear_to_genesis()
+        self._legitimate_recent = self._recent_blocks(self.legitimate_chain)
+        self._attack_recent = self._recent_blocks(self.attack_chain)
         
         # Reset metrics
         self.metrics = {
@@ -161,212 +441,188 @@ class AttackSimulator:
     
     def _run_simulation(self):
         """Main simulation loop."""
-        start_time = time.time()
+        start_time = time.monotonic()
         self.current_scenario = self.attack_type
+        self._refresh_status()
         
         try:
-            # Run the selected attack scenario
-            if self.attack_type in self.scenarios:
-                self.scenarios[self.attack_type]()
-            else:
-                self._simulate_51_percent_attack()
-                
+            # Keep PoW hashing off this process so it does not compete for the GIL
+            self._mining_pool = _shared_mining_pool()
+            self._run_scenario()
         except Exception as e:
             print(f"Simulation error: {e}")
         finally:
+            self._mining_pool = None
             self.is_running = False
-            self.metrics['attack_duration_actual'] = time.time() - start_time
+            self._refresh_status()
+            self.metrics['attack_duration_actual'] = time.monotonic() - start_time
+            self._end_metrics_pump(self._metrics_queue)
+            # Waiters are released before the completion callback, which may block
+            self._done_event.set()
             
             if self.on_attack_complete:
                 self.on_attack_complete(self.metrics)
     
-    def _simulate_51_percent_attack(self):
-        """Simulate a 51% attack."""
-        print("Starting 51% attack simulation...")
+    def _scenario_profile(self) -> Tuple:
+        """Look up the configured scenario, defaulting to a 51% attack."""
+        profile = self.SCENARIOS.get(self.attack_type, self.SCENARIOS['51_percent'])
+        p_attack = self.attack_power / 100 if profile[0] is None else profile[0]
+        return (p_attack,) + profile[1:]
+    
+    def _run_scenario(self):
+        """Race the attack chain against the legitimate chain until the deadline."""
+        (p_attack, p_legitimate, p_legitimate_after_attack,
+         warmup_blocks, setup, wrap_up) = self._scenario_profile()
+        print(f"Starting {self.attack_type} attack simulation...")
         
         # Create initial legitimate chain
-        self._mine_legitimate_blocks(5)
+        self._mine_legitimate_blocks(warmup_blocks)
+        if setup:
+            getattr(self, setup)()
         
         # Start attack
-        attack_start_time = time.time()
-        target_duration = self.attack_duration * 60  # Convert to seconds
-        
-        while self.is_running and (time.time() - attack_start_time) < target_duration:
+        target_duration_ns = int(self.attack_duration * 60 * 1_000_000_000)
+        progress_scale = 100.0 / max(target_duration_ns, 1)
+        deadline_ns = time.monotonic_ns() + target_duration_ns
+        publish_every = self.METRICS_PUBLISH_TICKS
+        n_attack = self.metrics['blocks_mined_attack']
+        n_legitimate = self.metrics['blocks_mined_legitimate']
+        tick = 0
+        draws = self._random_draws()
+        
+        while not self._stop_event.is_set():
             # Calculate attack progress
-            elapsed = time.time() - attack_start_time
-            self.attack_progress = min(100, (elapsed / target_duration) * 100)
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns <= 0:
+                break
+            self.attack_progress = 100.0 - remaining_ns * progress_scale
+            self._refresh_status()
             
-            # Simulate mining based on attack power
-            if random.random() < (self.attack_power / 100):
+            if next(draws) < p_attack:
                 # Attacker mines a block
-                self._mine_attack_block()
-                self.metrics['blocks_mined_attack'] += 1
-            else:
+                if self._mine_attack_block():
+                    n_attack += 1
+                
+                # A withheld block gives the legitimate network time to catch up
+                if p_legitimate_after_attack:
+                    if self._stop_event.wait(self.WITHHOLD_TICKS * self.tick_interval):
+                        break
+                    if next(draws) < p_legitimate_after_attack:
+                        if self._mine_legitimate_block():
+                            n_legitimate += 1
+            elif p_legitimate >= 1.0 or next(draws) < p_legitimate:
                 # Legitimate network mines a block
-                self._mine_legitimate_block()
-                self.metrics['blocks_mined_legitimate'] += 1
+                if self._mine_legitimate_block():
+                    n_legitimate += 1
             
             # Update progress callback
             if self.on_progress_update:
                 self.on_progress_update(self.attack_progress)
             
-            # Update metrics
-            self._update_attack_metrics()
+            # Publish metrics every few ticks
+            tick += 1
+            if tick % publish_every == 0:
+                self._publish_metrics(n_attack, n_legitimate)
             
-            time.sleep(1)  # Simulate time passing
+            # Simulate time passing
+            if self._stop_event.wait(self.tick_interval):
+                break
         
-        # Determine attack success
-        self._evaluate_attack_success()
+        self._publish_metrics(n_attack, n_legitimate)
+        if wrap_up:
+            getattr(self, wrap_up)()
     
-    def _simulate_double_spend(self):
-        """Simulate a double-spend attack."""
-        print("Starting double-spend attack simulation...")
-        
-        # Create initial legitimate chain
-        self._mine_legitimate_blocks(3)
-        
+    def _prepare_double_spend(self):
+        """Spend from the attacker wallet on the legitimate chain, then conflict it on the attack chain."""
         # Create a legitimate transaction
         victim_wallet = Wallet()
         legitimate_tx = self.attack_wallet.create_transaction(
             victim_wallet.address, 10.0
         )
         self.legitimate_chain.add_transaction(legitimate_tx)
-        self._mine_legitimate_block()
+        if self._mine_legitimate_block():
+            self.metrics['blocks_mined_legitimate'] += 1
         
         # Start attack - create conflicting transaction
         attack_tx = self.attack_wallet.create_transaction(
             self.attack_wallet.address, 10.0  # Send to self instead
         )
         self.attack_chain.add_transaction(attack_tx)
-        
-        # Mine attack chain faster
-        attack_start_time = time.time()
-        target_duration = self.attack_duration * 60
-        
-        while self.is_running and (time.time() - attack_start_time) < target_duration:
-            elapsed = time.time() - attack_start_time
-            self.attack_progress = min(100, (elapsed / target_duration) * 100)
-            
-            # Attack chain mines faster
-            if random.random() < 0.7:  # 70% chance for attack chain
-                self._mine_attack_block()
-                self.metrics['blocks_mined_attack'] += 1
-            else:
-                self._mine_legitimate_block()
-                self.metrics['blocks_mined_legitimate'] += 1
-            
-            if self.on_progress_update:
-                self.on_progress_update(self.attack_progress)
-            
-            time.sleep(1)
-        
-        # Check if double-spend was successful
+    
+    def _evaluate_double_spend(self):
+        """Check if double-spend was successful."""
         self.metrics['double_spend_success'] = (
             len(self.attack_chain.chain) > len(self.legitimate_chain.chain)
         )
     
-    def _simulate_selfish_mining(self):
-        """Simulate selfish mining attack."""
-        print("Starting selfish mining simulation...")
-        
-        # Create initial legitimate chain
-        self._mine_legitimate_blocks(3)
-        
-        attack_start_time = time.time()
-        target_duration = self.attack_duration * 60
-        
-        while self.is_running and (time.time() - attack_start_time) < target_duration:
-            elapsed = time.time() - attack_start_time
-            self.attack_progress = min(100, (elapsed / target_duration) * 100)
-            
-            # Selfish mining strategy
-            if random.random() < (self.attack_power / 100):
-                # Attacker finds block but doesn't broadcast immediately
-                self._mine_attack_block()
-                self.metrics['blocks_mined_attack'] += 1
-                
-                # Wait and see if legitimate network finds a block
-                time.sleep(2)
-                
-                if random.random() < 0.3:  # 30% chance legitimate network finds block
-                    self._mine_legitimate_block()
-                    self.metrics['blocks_mined_legitimate'] += 1
-            else:
-                # Legitimate network mines
-                self._mine_legitimate_block()
-                self.metrics['blocks_mined_legitimate'] += 1
-            
-            if self.on_progress_update:
-                self.on_progress_update(self.attack_progress)
-            
-            time.sleep(1)
-    
-    def _simulate_eclipse_attack(self):
-        """Simulate eclipse attack."""
-        print("Starting eclipse attack simulation...")
-        
-        # Create initial legitimate chain
-        self._mine_legitimate_blocks(3)
-        
-        attack_start_time = time.time()
-        target_duration = self.attack_duration * 60
-        
-        while self.is_running and (time.time() - attack_start_time) < target_duration:
-            elapsed = time.time() - attack_start_time
-            self.attack_progress = min(100, (elapsed / target_duration) * 100)
-            
-            # Eclipse attack reduces legitimate network connectivity
-            if random.random() < (self.attack_power / 100):
-                # Attack blocks are mined
-                self._mine_attack_block()
-                self.metrics['blocks_mined_attack'] += 1
-            else:
-                # Legitimate network has reduced mining power due to eclipse
-                if random.random() < 0.3:  # Only 30% chance due to eclipse
-                    self._mine_legitimate_block()
-                    self.metrics['blocks_mined_legitimate'] += 1
-            
-            if self.on_progress_update:
-                self.on_progress_update(self.attack_progress)
-            
-            time.sleep(1)
+    def _random_draws(self, batch_size: int = 256) -> Iterator[float]:
+        """Yield uniform [0, 1) samples, drawn from the generator in batches."""
+        while True:
+            yield from self._rng.random(batch_size).tolist()
     
     def _mine_legitimate_blocks(self, count: int):
         """Mine multiple legitimate blocks."""
         for _ in range(count):
-            self._mine_legitimate_block()
+            if self._mine_legitimate_block():
+                self.metrics['blocks_mined_legitimate'] += 1
     
-    def _mine_legitimate_block(self):
-        """Mine a single legitimate block."""
+    def _mine_legitimate_block(self) -> Optional[Block]:
+        """Mine a single legitimate block, returning it if one was mined."""
         # Create some transactions
-        for _ in range(random.randint(1, 5)):
-            tx = Transaction(
+        amounts = self._rng.uniform(0.1, 5.0, size=self._rng.integers(1, 6))
+        self.legitimate_chain.add_transactions([
+            Transaction(
                 sender="legitimate_sender",
                 recipient="legitimate_recipient",
-                amount=random.uniform(0.1, 5.0)
+                amount=amount
             )
-            self.legitimate_chain.add_transaction(tx)
+            for amount in amounts.tolist()
+        ])
         
         # Mine the block
-        block = self.legitimate_chain.mine_block("legitimate_miner")
+        block = self._mine_chain(self.legitimate_chain, "legitimate_miner")
         if block:
-            self.metrics['blocks_mined_legitimate'] += 1
+            self._legitimate_recent.append(block.to_dict())
+        return block
     
-    def _mine_attack_block(self):
-        """Mine a single attack block."""
+    def _mine_attack_block(self) -> Optional[Block]:
+        """Mine a single attack block, returning it if one was mined."""
         # Create attack transactions
-        for _ in range(random.randint(1, 3)):
-            tx = Transaction(
+        amounts = self._rng.uniform(0.1, 2.0, size=self._rng.integers(1, 4))
+        self.attack_chain.add_transactions([
+            Transaction(
                 sender=self.attack_wallet.address,
                 recipient=self.attack_wallet.address,
-                amount=random.uniform(0.1, 2.0)
+                amount=amount
             )
-            self.attack_chain.add_transaction(tx)
+            for amount in amounts.tolist()
+        ])
         
         # Mine the block
-        block = self.attack_chain.mine_block(self.attack_wallet.address)
+        block = self._mine_chain(self.attack_chain, self.attack_wallet.address)
         if block:
-            self.metrics['blocks_mined_attack'] += 1
+            self._attack_recent.append(block.to_dict())
+        return block
+    
+    @staticmethod
+    def _recent_blocks(chain: Blockchain, size: int = 5) -> deque:
+        """Serialize the last blocks of a chain into a bounded ring buffer."""
+        return deque((block.to_dict() for block in chain.chain[-size:]), maxlen=size)
+    
+    def _mine_chain(self, chain: Blockchain, miner_address: str) -> Optional[Block]:
+        """Mine the next block of a chain, solving its proof of work on the worker pool when one is set."""
+        if self._mining_pool is None:
+            return chain.mine_block(miner_address)
+        
+        block = chain.next_block_template()
+        if block is None:
+            return None
+        
+        block.proof, block.hash = self._mining_pool.submit(
+            _solve_block, block.to_dict(), chain.difficulty
+        ).result()
+        chain.append_mined_block(block, miner_address)
+        return block
     
     def _evaluate_attack_success(self):
         """Evaluate if the attack was successful."""
@@ -385,10 +641,45 @@ class AttackSimulator:
         if self.metrics['attack_success']:
             self.metrics['fork_resolution_time'] = self.metrics['attack_duration_actual']
     
+    def _publish_metrics(self, blocks_mined_attack: int, blocks_mined_legitimate: int):
+        """Swap in a new metrics snapshot so readers never see a partial update."""
+        self.metrics = {
+            **self.metrics,
+            'blocks_mined_attack': blocks_mined_attack,
+            'blocks_mined_legitimate': blocks_mined_legitimate
+        }
+        self._update_attack_metrics()
+    
     def _update_attack_metrics(self):
-        """Update attack metrics during simulation."""
+        """Queue a metrics snapshot for the callback, dropping it if the consumer is behind."""
         if self.on_metrics_update:
-            self.on_metrics_update(self.metrics)
+            try:
+                self._metrics_queue.put_nowait(dict(self.metrics))
+            except queue.Full:
+                pass
+    
+    def _metrics_pump(self, metrics_queue: queue.Queue):
+        """Invoke the metrics callback for each queued snapshot until the run ends."""
+        for snapshot in iter(metrics_queue.get, None):
+            callback = self.on_metrics_update
+            if callback:
+                try:
+                    callback(snapshot)
+                except Exception as e:
+                    print(f"Metrics callback error: {e}")
+    
+    @staticmethod
+    def _end_metrics_pump(metrics_queue: queue.Queue):
+        """Queue the end-of-run sentinel without blocking, evicting stale snapshots if full."""
+        while True:
+            try:
+                metrics_queue.put_nowait(None)
+                return
+            except queue.Full:
+                try:
+                    metrics_queue.get_nowait()
+                except queue.Empty:
+                    pass
     
     def set_progress_callback(self, callback: Callable[[int], None]):
         """Set callback for progress updates."""
@@ -417,15 +708,21 @@ class AttackSimulator:
             'success_rate': self._calculate_success_rate()
         }
     
+    def export_simulation_report_bytes(self) -> bytes:
+        """Export the simulation report as a compact binary pickle."""
+        return pickle.dumps(self.export_simulation_report(), protocol=5)
+    
     def _calculate_success_rate(self) -> float:
         """Calculate attack success rate based on metrics."""
-        if self.metrics['attack_duration_actual'] == 0:
-            return 0.0
-        
-        # Complex success rate calculation based on multiple factors
-        power_factor = self.attack_power / 100
-        duration_factor = min(1.0, self.metrics['attack_duration_actual'] / (self.attack_duration * 60))
-        block_ratio = self.metrics['blocks_mined_attack'] / max(1, self.metrics['blocks_mined_attack'] + self.metrics['blocks_mined_legitimate'])
-        
-        success_rate = (power_factor * 0.4 + duration_factor * 0.3 + block_ratio * 0.3) * 100
-        return min(100.0, success_rate) 
\ No newline at end of file
+        metrics = self.metrics
+        duration = metrics['attack_duration_actual']
+        attack_blocks = metrics['blocks_mined_attack']
+        total_blocks = attack_blocks + metrics['blocks_mined_legitimate']
+        
+        # Weighted power (40%), duration (30%) and block share (30%); zero until the run has time on it
+        success_rate = (
+            self.attack_power * 0.4
+            + min(1.0, duration / max(1e-9, self.attack_duration * 60)) * 30.0
+            + attack_blocks / max(1, total_blocks) * 30.0
+        )
+        return min(100.0, success_rate * (duration > 0))
@@ -3,14 +3,27 @@ ScenarioGenerator for BlockyHomework blockchain system.
 Creates and manages attack simulation scenarios.
 """
 
-import json
+import asyncio
+import multiprocessing
+import os
 import random
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-from dataclasses import dataclass, asdict
+import time
+from typing import Dict, List, Any, Optional, Tuple, Callable, AsyncIterator
+from dataclasses import dataclass, fields
 from enum import Enum
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-from .attack_simulator import AttackSimulator
+import numpy as np
+import orjson
+
+from .attack_simulator import AttackSimulator, use_inline_mining
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO 8601 string with second precision."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
 
 
 class AttackType(Enum):
@@ -39,7 +52,7 @@ class AttackScenario:
     
     def __post_init__(self):
         if self.created_at is None:
-            self.created_at = datetime.now().isoformat()
+            self.created_at = _now_iso()
 
 
 @dataclass
@@ -55,16 +68,135 @@ class SimulationResult:
     analysis: Dict[str, Any]
 
 
+# Default success criteria for custom scenarios, by attack type
+_DEFAULT_SUCCESS_CRITERIA: Dict[AttackType, Dict[str, Any]] = {
+    AttackType.FIFTY_ONE_PERCENT: {
+        'min_blocks_ahead': 2,
+        'network_impact': 0.6
+    },
+    AttackType.DOUBLE_SPEND: {
+        'double_spend_success': True,
+        'confirmation_depth': 1
+    },
+    AttackType.SELFISH_MINING: {
+        'revenue_increase': 0.1,
+        'block_advantage': 1
+    },
+    AttackType.ECLIPSE: {
+        'isolated_nodes': 0.3,
+        'network_fragmentation': 0.5
+    }
+}
+
+# Mitigations suggested when a result's metric exceeds the threshold:
+# attack type -> (metric, threshold, mitigations)
+_MITIGATIONS: Dict[AttackType, Tuple[str, float, Tuple[str, ...]]] = {
+    AttackType.FIFTY_ONE_PERCENT: ('attack_success', 0, (
+        "Implement stronger consensus mechanisms",
+        "Increase network decentralization",
+        "Add checkpoint mechanisms",
+        "Implement chain reorganization limits"
+    )),
+    AttackType.DOUBLE_SPEND: ('double_spend_success', 0, (
+        "Increase confirmation requirements",
+        "Implement transaction finality",
+        "Add double-spend detection",
+        "Use multi-signature transactions"
+    )),
+    AttackType.SELFISH_MINING: ('revenue_increase', 0.1, (
+        "Implement uncle block rewards",
+        "Add selfish mining detection",
+        "Use alternative consensus mechanisms",
+        "Implement block withholding penalties"
+    )),
+    AttackType.ECLIPSE: ('isolated_nodes', 0.3, (
+        "Implement peer diversity requirements",
+        "Add network topology monitoring",
+        "Use secure peer discovery",
+        "Implement connection limits"
+    ))
+}
+
+
+@lru_cache(maxsize=None)
+def _default_criteria(attack_type: AttackType) -> Tuple[Tuple[str, Any], ...]:
+    """Frozen default success criteria for an attack type."""
+    return tuple(_DEFAULT_SUCCESS_CRITERIA.get(attack_type, {}).items())
+
+
+@lru_cache(maxsize=None)
+def _mitigations(attack_type: AttackType, triggered: bool) -> Tuple[str, ...]:
+    """Mitigations to suggest for an attack type, given whether its trigger metric crossed the threshold."""
+    if not triggered:
+        return ()
+    return _MITIGATIONS.get(attack_type, (None, 0, ()))[2]
+
+
+def _effectiveness_kernel(attack_blocks, legitimate_blocks, network_impact, attack_success, attack_power):
+    """
+    Attack ratio, efficiency score and success rate of simulation metrics.
+    
+    Works elementwise on scalars or equal-length NumPy arrays, so a whole
+    batch of results can be scored in one vectorized call.
+    """
+    attack_ratio = attack_blocks / np.maximum(1, attack_blocks + legitimate_blocks)
+    efficiency_score = attack_ratio * (attack_power / 100)
+    success_rate = (attack_success + network_impact / 100 + attack_ratio) / 3 * 100
+    return attack_ratio, efficiency_score, success_rate
+
+
+def _numeric_row(result: SimulationResult) -> Tuple[float, ...]:
+    """Success, duration, network impact, attack blocks and legitimate blocks of a result."""
+    metrics = result.metrics
+    return (result.success, result.duration, metrics.get('network_impact', 0),
+            metrics.get('blocks_mined_attack', 0), metrics.get('blocks_mined_legitimate', 0))
+
+
+def _shallow_asdict(result: SimulationResult) -> Dict[str, Any]:
+    """Field dict of a result that shares its nested dicts instead of deep-copying them like asdict()."""
+    return {field.name: getattr(result, field.name) for field in fields(result)}
+
+
+# Generator (and simulator) owned by a batch worker process, kept across its scenarios
+_WORKER_GENERATOR = None
+
+
+# Batch workers are spawned: forking would copy the parent's threads' state, including
+# the mining pool's, into each worker
+_BATCH_CONTEXT = multiprocessing.get_context('spawn')
+
+
+def _worker_init():
+    """Create the worker process's generator once, when the worker starts."""
+    global _WORKER_GENERATOR
+    # The worker is already a separate process; a nested mining pool would only add more
+    use_inline_mining()
+    _WORKER_GENERATOR = ScenarioGenerator()
+
+
+def _run_sub_batch(scenarios: List[AttackScenario]) -> List[Any]:
+    """Run scenarios on the worker's generator, returning a result or the raised exception for each."""
+    outcomes = []
+    for scenario in scenarios:
+        try:
+            outcomes.append(_WORKER_GENERATOR.run_scenario(scenario))
+        except Exception as e:
+            outcomes.append(e)
+    return outcomes
+
+
 class ScenarioGenerator:
     """
     Generates and manages attack simulation scenarios.
     Provides predefined scenarios and custom scenario creation.
     """
     
-    def __init__(self):
+    def __init__(self, max_history: int = 1000, history_path: Optional[str] = None):
         self.predefined_scenarios = self._create_predefined_scenarios()
         self.custom_scenarios = {}
-        self.simulation_history = []
+        # Most recent results; when history_path is set, a full history is spilled there
+        self.simulation_history = deque(maxlen=max_history)
+        self.history_path = history_path
         self.attack_simulator = AttackSimulator()
     
     def get_predefined_scenarios(self) -> List[AttackScenario]:
@@ -124,7 +256,7 @@ class ScenarioGenerator:
         Returns:
             SimulationResult: Simulation results
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         # Configure simulator
         self.attack_simulator.attack_type = scenario.attack_type.value
@@ -143,14 +275,12 @@ class ScenarioGenerator:
         if not success:
             raise RuntimeError("Failed to start simulation")
         
-        # Wait for simulation to complete
-        while self.attack_simulator.is_running:
-            import time
-            time.sleep(0.1)
+        # Wait for simulation to complete, stopping one that overruns its duration
+        if not self.attack_simulator.wait_for_completion(timeout=scenario.duration * 60 + 5):
+            self.attack_simulator.stop_simulation()
         
         # Get results
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         
         metrics = self.attack_simulator.get_attack_metrics()
         chain_comparison = self.attack_simulator.get_chain_comparison()
@@ -162,55 +292,159 @@ class ScenarioGenerator:
             success=metrics['attack_success'],
             metrics=metrics,
             duration=duration,
-            timestamp=end_time.isoformat(),
+            timestamp=_now_iso(),
             chain_comparison=chain_comparison,
             analysis=self._analyze_results(scenario, metrics, chain_comparison)
         )
         
         # Store in history
-        self.simulation_history.append(result)
+        self._record_history(result)
         
         return result
     
-    def run_scenario_batch(self, scenarios: List[AttackScenario]) -> List[SimulationResult]:
+    def run_scenario_batch(self, scenarios: List[AttackScenario],
+                          max_workers: Optional[int] = None) -> List[SimulationResult]:
         """
-        Run multiple scenarios in batch.
+        Run multiple scenarios in batch, in parallel worker processes.
         
         Args:
             scenarios: List of scenarios to run
+            max_workers: Number of worker processes (defaults to the CPU count)
             
         Returns:
-            List[SimulationResult]: Results for all scenarios
+            List[SimulationResult]: Results for all scenarios, in input order
         """
-        results = []
-        
-        for scenario in scenarios:
-            try:
-                result = self.run_scenario(scenario)
-                results.append(result)
-            except Exception as e:
-                print(f"Error running scenario {scenario.name}: {e}")
-                # Create error result
-                error_result = SimulationResult(
-                    scenario_name=scenario.name,
-                    attack_type=scenario.attack_type.value,
-                    success=False,
-                    metrics={'error': str(e)},
-                    duration=0,
-                    timestamp=datetime.now().isoformat(),
-                    chain_comparison={},
-                    analysis={'error': str(e)}
-                )
-                results.append(error_result)
+        results = [None] * len(scenarios)
+        if not scenarios:
+            return results
+        
+        # One sub-batch per worker, striped so long and short scenarios spread evenly
+        n_workers = min(max_workers or os.cpu_count() or 1, len(scenarios))
+        chunks = [range(start, len(scenarios), n_workers) for start in range(n_workers)]
+        
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=_BATCH_CONTEXT,
+                                 initializer=_worker_init) as executor:
+            futures = {
+                executor.submit(_run_sub_batch, [scenarios[index] for index in chunk]): chunk
+                for chunk in chunks
+            }
+            
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    outcomes = future.result()
+                except Exception as e:
+                    outcomes = [e] * len(chunk)
+                
+                for index, outcome in zip(chunk, outcomes):
+                    results[index] = self._collect_outcome(scenarios[index], outcome)
         
         return results
     
-    def generate_comparison_report(self, results: List[SimulationResult]) -> Dict[str, Any]:
+    async def run_scenario_batch_streaming(self, scenarios: List[AttackScenario],
+                                           max_workers: Optional[int] = None,
+                                           on_progress: Optional[Callable[[int, int, float], None]] = None,
+                                           stop_event: Optional[asyncio.Event] = None
+                                           ) -> AsyncIterator[SimulationResult]:
+        """
+        Run scenarios in worker processes, yielding each result as soon as it completes.
+        
+        Args:
+            scenarios: List of scenarios to run
+            max_workers: Number of worker processes (defaults to the CPU count)
+            on_progress: Called with (completed, total, estimated seconds remaining)
+            stop_event: When set, scenarios that have not started yet are skipped
+            
+        Yields:
+            SimulationResult: Results in completion order
+        """
+        if not scenarios:
+            return
+        
+        loop = asyncio.get_running_loop()
+        results = asyncio.Queue()
+        n_workers = min(max_workers or os.cpu_count() or 1, len(scenarios))
+        slots = asyncio.Semaphore(n_workers)
+        executor = ProcessPoolExecutor(max_workers=n_workers, mp_context=_BATCH_CONTEXT,
+                                       initializer=_worker_init)
+        
+        async def run(scenario: AttackScenario):
+            async with slots:
+                if stop_event is not None and stop_event.is_set():
+                    await results.put(None)
+                    return
+                try:
+                    outcome = (await loop.run_in_executor(executor, _run_sub_batch, [scenario]))[0]
+                except Exception as e:
+                    outcome = e
+                await results.put(self._collect_outcome(scenario, outcome))
+        
+        tasks = [asyncio.create_task(run(scenario)) for scenario in scenarios]
+        start = time.perf_counter()
+        try:
+            for completed in range(1, len(scenarios) + 1):
+                result = await results.get()
+                if on_progress:
+                    elapsed = time.perf_counter() - start
+                    on_progress(completed, len(scenarios), elapsed / completed * (len(scenarios) - completed))
+                if result is not None:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _collect_outcome(self, scenario: AttackScenario, outcome: Any) -> SimulationResult:
+        """Record a worker's result in the history, or turn its exception into an error result."""
+        if not isinstance(outcome, Exception):
+            self._record_history(outcome)
+            return outcome
+        
+        print(f"Error running scenario {scenario.name}: {outcome}")
+        return SimulationResult(
+            scenario_name=scenario.name,
+            attack_type=scenario.attack_type.value,
+            success=False,
+            metrics={'error': str(outcome)},
+            duration=0,
+            timestamp=_now_iso(),
+            chain_comparison={},
+            analysis={'error': str(outcome)}
+        )
+    
+    def flush_history(self, path: str) -> int:
+        """
+        Append the in-memory simulation history to a JSON Lines file and clear it.
+        
+        Args:
+            path: JSON Lines file to append to
+            
+        Returns:
+            int: Number of results written
+        """
+        count = len(self.simulation_history)
+        with open(path, 'ab') as f:
+            for result in self.simulation_history:
+                f.write(orjson.dumps(result, default=str))
+                f.write(b'\n')
+        self.simulation_history.clear()
+        return count
+    
+    def _record_history(self, result: SimulationResult):
+        """Add a result to the history, spilling it to disk first if it is full."""
+        history = self.simulation_history
+        if self.history_path and len(history) == history.maxlen:
+            self.flush_history(self.history_path)
+        history.append(result)
+    
+    def generate_comparison_report(self, results: List[SimulationResult],
+                                   include_details: bool = True) -> Dict[str, Any]:
         """
         Generate a comparison report for multiple simulation results.
         
         Args:
             results: List of simulation results
+            include_details: Include every result as a dict under 'detailed_results'
             
         Returns:
             Dict: Comparison report
@@ -218,42 +452,42 @@ class ScenarioGenerator:
         if not results:
             return {}
         
-        # Calculate statistics
+        # Column view of the results, aggregated per attack type with bincount;
+        # attack types keep the order they are first seen in
         total_scenarios = len(results)
-        successful_attacks = sum(1 for r in results if r.success)
+        attack_types = list(dict.fromkeys(r.attack_type for r in results))
+        type_positions = {attack_type: i for i, attack_type in enumerate(attack_types)}
+        type_index = np.array([type_positions[r.attack_type] for r in results])
+        columns = np.array([_numeric_row(r) for r in results], dtype=float)
+        success = columns[:, 0].astype(bool)
+        durations, network_impact = columns[:, 1:3].T
+        
+        successful_attacks = int(success.sum())
         success_rate = (successful_attacks / total_scenarios) * 100
-        
-        # Average metrics
-        avg_duration = sum(r.duration for r in results) / total_scenarios
-        avg_network_impact = sum(r.metrics.get('network_impact', 0) for r in results) / total_scenarios
-        
-        # Group by attack type
-        attack_type_stats = {}
-        for result in results:
-            attack_type = result.attack_type
-            if attack_type not in attack_type_stats:
-                attack_type_stats[attack_type] = {
-                    'count': 0,
-                    'successful': 0,
-                    'avg_duration': 0,
-                    'avg_network_impact': 0
-                }
-            
-            stats = attack_type_stats[attack_type]
-            stats['count'] += 1
-            if result.success:
-                stats['successful'] += 1
-            stats['avg_duration'] += result.duration
-            stats['avg_network_impact'] += result.metrics.get('network_impact', 0)
+        avg_duration = float(durations.mean())
+        avg_network_impact = float(network_impact.mean())
         
         # Calculate averages for each attack type
-        for attack_type, stats in attack_type_stats.items():
-            count = stats['count']
-            stats['avg_duration'] /= count
-            stats['avg_network_impact'] /= count
-            stats['success_rate'] = (stats['successful'] / count) * 100
+        counts = np.bincount(type_index)
+        successful = np.bincount(type_index, weights=success).astype(int)
+        type_avg_duration = np.bincount(type_index, weights=durations) / counts
+        type_avg_impact = np.bincount(type_index, weights=network_impact) / counts
+        type_success_rate = successful / counts * 100
+        attack_type_stats = {
+            attack_type: {
+                'count': count,
+                'successful': n_successful,
+                'avg_duration': avg_type_duration,
+                'avg_network_impact': avg_type_impact,
+                'success_rate': rate
+            }
+            for attack_type, count, n_successful, avg_type_duration, avg_type_impact, rate in zip(
+                attack_types, counts.tolist(), successful.tolist(),
+                type_avg_duration.tolist(), type_avg_impact.tolist(), type_success_rate.tolist()
+            )
+        }
         
-        return {
+        report = {
             'summary': {
                 'total_scenarios': total_scenarios,
                 'successful_attacks': successful_attacks,
@@ -262,9 +496,12 @@ class ScenarioGenerator:
                 'avg_network_impact': avg_network_impact
             },
             'attack_type_analysis': attack_type_stats,
-            'detailed_results': [asdict(result) for result in results],
             'recommendations': self._generate_recommendations(results)
         }
+        if include_details:
+            report['detailed_results'] = [_shallow_asdict(result) for result in results]
+        
+        return report
     
     def export_report(self, results: List[SimulationResult], 
                      filename: str = None) -> str:
@@ -279,21 +516,31 @@ class ScenarioGenerator:
             str: Path to exported file
         """
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"blockchain_attack_report_{timestamp}.json"
         
-        report = {
-            'metadata': {
-                'generated_at': datetime.now().isoformat(),
-                'total_scenarios': len(results),
-                'generator_version': '1.0.0'
-            },
-            'comparison_report': self.generate_comparison_report(results),
-            'individual_results': [asdict(result) for result in results]
+        metadata = {
+            'generated_at': _now_iso(),
+            'total_scenarios': len(results),
+            'generator_version': '1.0.0'
         }
-        
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Per-result dicts are written once, under individual_results
+        comparison_report = self.generate_comparison_report(results, include_details=False)
+        
+        # Stream results one at a time rather than building the whole report in memory;
+        # orjson serializes the SimulationResult dataclasses directly
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        with open(filename, 'wb') as f:
+            f.write(b'{\n"metadata": ')
+            f.write(orjson.dumps(metadata, option=options))
+            f.write(b',\n"comparison_report": ')
+            f.write(orjson.dumps(comparison_report, default=str, option=options))
+            f.write(b',\n"individual_results": [\n')
+            for i, result in enumerate(results):
+                if i:
+                    f.write(b',\n')
+                f.write(orjson.dumps(result, default=str, option=options))
+            f.write(b'\n]\n}\n')
         
         return filename
     
@@ -405,26 +652,7 @@ class ScenarioGenerator:
     
     def _get_default_success_criteria(self, attack_type: AttackType) -> Dict[str, Any]:
         """Get default success criteria for an attack type."""
-        criteria = {
-            AttackType.FIFTY_ONE_PERCENT: {
-                'min_blocks_ahead': 2,
-                'network_impact': 0.6
-            },
-            AttackType.DOUBLE_SPEND: {
-                'double_spend_success': True,
-                'confirmation_depth': 1
-            },
-            AttackType.SELFISH_MINING: {
-                'revenue_increase': 0.1,
-                'block_advantage': 1
-            },
-            AttackType.ECLIPSE: {
-                'isolated_nodes': 0.3,
-                'network_fragmentation': 0.5
-            }
-        }
-        
-        return criteria.get(attack_type, {})
+        return dict(_default_criteria(attack_type))
     
     def _analyze_results(self, scenario: AttackScenario, 
                         metrics: Dict[str, Any], 
@@ -466,24 +694,31 @@ class ScenarioGenerator:
     
     def _calculate_attack_effectiveness(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate attack effectiveness metrics."""
-        total_blocks = metrics.get('blocks_mined_attack', 0) + metrics.get('blocks_mined_legitimate', 0)
-        attack_ratio = metrics.get('blocks_mined_attack', 0) / max(1, total_blocks)
+        network_impact = metrics.get('network_impact', 0)
+        attack_ratio, efficiency_score, _ = _effectiveness_kernel(
+            metrics.get('blocks_mined_attack', 0),
+            metrics.get('blocks_mined_legitimate', 0),
+            network_impact,
+            metrics.get('attack_success', False),
+            metrics.get('attack_power', 0)
+        )
         
         return {
-            'attack_ratio': attack_ratio,
-            'network_impact': metrics.get('network_impact', 0),
-            'efficiency_score': attack_ratio * (metrics.get('attack_power', 0) / 100)
+            'attack_ratio': float(attack_ratio),
+            'network_impact': network_impact,
+            'efficiency_score': float(efficiency_score)
         }
     
     def _assess_network_resilience(self, metrics: Dict[str, Any], 
                                  chain_comparison: Dict[str, Any]) -> Dict[str, Any]:
         """Assess network resilience against the attack."""
-        legitimate_blocks = len(chain_comparison.get('legitimate_chain', {}).get('blocks', []))
-        attack_blocks = len(chain_comparison.get('attack_chain', {}).get('blocks', []))
+        legitimate_blocks = len(chain_comparison.get('legitimate_chain', {}).get('blocks', ()))
+        attack_blocks = len(chain_comparison.get('attack_chain', {}).get('blocks', ()))
         
+        # A positive legitimate count already keeps the denominator above zero
         resilience_score = 0
         if legitimate_blocks > 0:
-            resilience_score = legitimate_blocks / max(1, legitimate_blocks + attack_blocks)
+            resilience_score = legitimate_blocks / (legitimate_blocks + attack_blocks)
         
         return {
             'resilience_score': resilience_score,
@@ -495,14 +730,18 @@ class ScenarioGenerator:
     def _assess_attack_risk(self, scenario: AttackScenario, 
                           metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Assess the risk level of the attack."""
+        attack_power = scenario.attack_power / 100
+        duration = scenario.duration / 60  # Convert to hours
+        network_size = scenario.network_size / 1000  # Normalize
+        attack_success = metrics.get('attack_success', False)
         risk_factors = {
-            'attack_power': scenario.attack_power / 100,
-            'duration': scenario.duration / 60,  # Convert to hours
-            'network_size': scenario.network_size / 1000,  # Normalize
-            'success_rate': metrics.get('attack_success', False)
+            'attack_power': attack_power,
+            'duration': duration,
+            'network_size': network_size,
+            'success_rate': attack_success
         }
         
-        overall_risk = sum(risk_factors.values()) / len(risk_factors)
+        overall_risk = (attack_power + duration + network_size + attack_success) / 4
         
         risk_level = "low"
         if overall_risk > 0.7:
@@ -519,52 +758,25 @@ class ScenarioGenerator:
     def _suggest_mitigations(self, scenario: AttackScenario, 
                            metrics: Dict[str, Any]) -> List[str]:
         """Suggest mitigation strategies based on attack results."""
-        mitigations = []
-        
-        if scenario.attack_type == AttackType.FIFTY_ONE_PERCENT:
-            if metrics.get('attack_success', False):
-                mitigations.extend([
-                    "Implement stronger consensus mechanisms",
-                    "Increase network decentralization",
-                    "Add checkpoint mechanisms",
-                    "Implement chain reorganization limits"
-                ])
-        
-        elif scenario.attack_type == AttackType.DOUBLE_SPEND:
-            if metrics.get('double_spend_success', False):
-                mitigations.extend([
-                    "Increase confirmation requirements",
-                    "Implement transaction finality",
-                    "Add double-spend detection",
-                    "Use multi-signature transactions"
-                ])
-        
-        elif scenario.attack_type == AttackType.SELFISH_MINING:
-            if metrics.get('revenue_increase', 0) > 0.1:
-                mitigations.extend([
-                    "Implement uncle block rewards",
-                    "Add selfish mining detection",
-                    "Use alternative consensus mechanisms",
-                    "Implement block withholding penalties"
-                ])
-        
-        elif scenario.attack_type == AttackType.ECLIPSE:
-            if metrics.get('isolated_nodes', 0) > 0.3:
-                mitigations.extend([
-                    "Implement peer diversity requirements",
-                    "Add network topology monitoring",
-                    "Use secure peer discovery",
-                    "Implement connection limits"
-                ])
-        
-        return mitigations
+        metric, threshold, _ = _MITIGATIONS.get(scenario.attack_type, (None, 0, ()))
+        triggered = metric is not None and metrics.get(metric, 0) > threshold
+        return list(_mitigations(scenario.attack_type, triggered))
+    
+    def _generate_recommendations(self, results: List[SimulationResult]) -> List[str]:
+        """Mitigations suggested for any of the results, in first-seen order without duplicates."""
+        return list(dict.fromkeys(
+            suggestion
+            for result in results
+            for suggestion in result.analysis.get('mitigation_suggestions', ())
+        ))
     
     def _calculate_success_rate(self, metrics: Dict[str, Any]) -> float:
         """Calculate overall success rate based on metrics."""
-        factors = [
+        _, _, success_rate = _effectiveness_kernel(
+            metrics.get('blocks_mined_attack', 0),
+            metrics.get('blocks_mined_legitimate', 0),
+            metrics.get('network_impact', 0),
             metrics.get('attack_success', False),
-            metrics.get('network_impact', 0) / 100,
-            metrics.get('blocks_mined_attack', 0) / max(1, metrics.get('blocks_mined_attack', 0) + metrics.get('blocks_mined_legitimate', 0))
-        ]
-        
-        return sum(factors) / len(factors) * 100 
\ No newline at end of file
+            metrics.get('attack_power', 0)
+        )
+        return float(success_rate) 
\ No newline at end of file
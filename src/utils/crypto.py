@@ -3,8 +3,92 @@ CryptoUtils for BlockyHomework blockchain system.
 Cryptographic utilities and functions.
 """
 
-# TODO: Implement CryptoUtils class with:
-# - ECDSA key pair generation
-# - Digital signature creation and verification
-# - SHA-256 hashing functions
-# - Secure random number generation 
\ No newline at end of file
+import hashlib
+import secrets
+from typing import Tuple
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+
+# Bound once; hashlib's OpenSSL SHA-256 uses SHA-NI / ARMv8 crypto extensions when available
+_sha256 = hashlib.sha256
+_CURVE = ec.SECP256K1()
+
+
+class CryptoUtils:
+    """
+    Hashing, ECDSA and randomness helpers backed by OpenSSL.
+    Keys and signatures use the same hex encodings as the ecdsa-based models.
+    """
+
+    @staticmethod
+    def sha256(data: bytes) -> bytes:
+        """SHA-256 digest of data."""
+        return _sha256(data).digest()
+
+    @staticmethod
+    def sha256_hex(data: bytes) -> str:
+        """SHA-256 digest of data as a hex string."""
+        return _sha256(data).hexdigest()
+
+    @staticmethod
+    def sha256_hasher(prefix: bytes = b''):
+        """Hasher already fed with prefix, for reuse with sha256_copy."""
+        return _sha256(prefix)
+
+    @staticmethod
+    def sha256_copy(base_hasher, suffix: bytes) -> bytes:
+        """
+        SHA-256 of the base hasher's input followed by suffix.
+
+        Copying keeps the base's midstate, so only the suffix is hashed; use it
+        when many inputs share a prefix, e.g. proof-of-work nonce tails.
+        """
+        hasher = base_hasher.copy()
+        hasher.update(suffix)
+        return hasher.digest()
+
+    @staticmethod
+    def generate_key_pair() -> Tuple[str, str]:
+        """
+        Generate a secp256k1 key pair.
+
+        Returns:
+            Tuple of (private key hex, public key hex as raw X||Y)
+        """
+        private_key = ec.generate_private_key(_CURVE)
+        numbers = private_key.private_numbers()
+        public = numbers.public_numbers
+        return (
+            numbers.private_value.to_bytes(32, 'big').hex(),
+            (public.x.to_bytes(32, 'big') + public.y.to_bytes(32, 'big')).hex()
+        )
+
+    @staticmethod
+    def sign(private_key: str, message: bytes) -> str:
+        """DER-encoded ECDSA signature of message as hex."""
+        key = ec.derive_private_key(int(private_key, 16), _CURVE)
+        return key.sign(message, ec.ECDSA(hashes.SHA1())).hex()
+
+    @staticmethod
+    def verify(public_key: str, message: bytes, signature: str) -> bool:
+        """Check a hex DER signature of message against a raw X||Y public key."""
+        try:
+            key = ec.EllipticCurvePublicKey.from_encoded_point(
+                _CURVE, b'\x04' + bytes.fromhex(public_key)
+            )
+            key.verify(bytes.fromhex(signature), message, ec.ECDSA(hashes.SHA1()))
+            return True
+        except (InvalidSignature, ValueError):
+            return False
+
+    @staticmethod
+    def random_bytes(n: int = 32) -> bytes:
+        """Cryptographically secure random bytes."""
+        return secrets.token_bytes(n)
+
+    @staticmethod
+    def random_hex(n: int = 32) -> str:
+        """Cryptographically secure random bytes as a hex string."""
+        return secrets.token_hex(n)
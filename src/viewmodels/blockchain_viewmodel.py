@@ -4,11 +4,17 @@ Manages blockchain display and transaction list formatting.
 """
 
 from models.blockchain import Blockchain
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 class BlockchainViewModel:
     def __init__(self, blockchain: Blockchain):
         self.blockchain = blockchain
+        # Formatted lists are reused until the chain length or tip hash changes; callers
+        # get copies, so extending the cache never changes a list already handed out
+        self._chain_cache_key = None
+        self._chain_cache = []
+        self._tx_cache_key = None
+        self._tx_dicts = []
         self.state = {
             'chain_display': self.format_chain_for_ui(),
             'transaction_list': self.format_transaction_list(),
@@ -16,15 +22,47 @@ class BlockchainViewModel:
             'network_state': None
         }
 
+    def _chain_key(self) -> Tuple[int, Optional[str]]:
+        chain = self.blockchain.chain
+        return (len(chain), chain[-1].hash if chain else None)
+
+    def _formatted_height(self, cache_key: Optional[Tuple[int, Optional[str]]]) -> int:
+        # Number of leading blocks a cache built at cache_key still matches, 0 if the chain was replaced
+        chain = self.blockchain.chain
+        height = cache_key[0] if cache_key else 0
+        if 0 < height <= len(chain) and chain[height - 1].hash == cache_key[1]:
+            return height
+        return 0
+
     def format_chain_for_ui(self) -> List[Dict[str, Any]]:
-        return [block.to_dict() for block in self.blockchain.chain]
+        key = self._chain_key()
+        if key == self._chain_cache_key:
+            return list(self._chain_cache)
+
+        height = self._formatted_height(self._chain_cache_key)
+        if not height:
+            self._chain_cache = []
+        # Only format blocks added since the last call
+        self._chain_cache.extend(block.to_dict() for block in self.blockchain.chain[height:])
+        self._chain_cache_key = key
+        return list(self._chain_cache)
 
     def format_transaction_list(self) -> List[Dict[str, Any]]:
-        txs = []
-        for block in self.blockchain.chain:
-            for tx in block.transactions:
-                txs.append(tx.to_dict())
-        return txs
+        key = self._chain_key()
+        if key == self._tx_cache_key:
+            return list(self._tx_dicts)
+
+        height = self._formatted_height(self._tx_cache_key)
+        if not height:
+            self._tx_dicts = []
+        for block in self.blockchain.chain[height:]:
+            self._tx_dicts.extend(tx.to_dict() for tx in block.transactions)
+        self._tx_cache_key = key
+        return list(self._tx_dicts)
+
+    def invalidate(self):
+        self._chain_cache_key = None
+        self._tx_cache_key = None
 
     def get_mining_status(self) -> Dict[str, Any]:
         return {
@@ -34,6 +72,7 @@ class BlockchainViewModel:
         }
 
     def set_network_state(self, state: Any):
+        self.invalidate()
         self.state['network_state'] = state
 
     def get_chain_display(self) -> List[Dict[str, Any]]:
@@ -14,19 +14,21 @@ class NodeViewModel:
         self.blockchain = blockchain
         self.wallet = wallet
         self.mempool = blockchain.mempool
+        self._balance = 0.0
         self.state = {
             'chain_display': self.format_chain(),
             'wallet_balance_display': self.format_balance(),
             'connected_nodes_display': [],
             'pending_transactions': self.format_pending_transactions()
         }
+        self._pending_version = self.mempool.version
 
     def format_chain(self) -> List[Dict[str, Any]]:
         return [block.to_dict() for block in self.blockchain.chain]
 
     def format_balance(self) -> str:
-        balance = self.wallet.get_balance(self.blockchain)
-        return f"{balance:.3f} ZTL Coin"
+        self._balance = self.wallet.get_balance(self.blockchain)
+        return f"{self._balance:.3f} ZTL Coin"
 
     def format_pending_transactions(self) -> List[Dict[str, Any]]:
         return [tx.to_dict() for tx in self.mempool.get_transactions()]
@@ -36,13 +38,36 @@ class NodeViewModel:
         return self.blockchain.add_transaction(tx)
 
     def mine_new_block(self) -> bool:
+        pending_synced = self._pending_version == self.mempool.version
         block = self.blockchain.mine_block(self.wallet.address)
-        if block:
+        if not block:
+            return False
+
+        if len(self.state['chain_display']) != block.index:
+            # Display is out of step with the chain (e.g. it was replaced), rebuild everything
             self.state['chain_display'] = self.format_chain()
             self.state['wallet_balance_display'] = self.format_balance()
             self.state['pending_transactions'] = self.format_pending_transactions()
+            self._pending_version = self.mempool.version
             return True
-        return False
+
+        # Apply just the new block: append it, settle its transactions, drop them from pending
+        self.state['chain_display'].append(block.to_dict())
+        address = self.wallet.address
+        mined_hashes = set()
+        for tx in block.transactions:
+            if tx.recipient == address:
+                self._balance += tx.amount
+            if tx.sender == address:
+                self._balance -= tx.amount
+            mined_hashes.add(tx.hash)
+        self.state['wallet_balance_display'] = f"{self._balance:.3f} ZTL Coin"
+        self.state['pending_transactions'] = [
+            tx for tx in self.state['pending_transactions'] if tx['hash'] not in mined_hashes
+        ]
+        if pending_synced:
+            self._pending_version = self.mempool.version
+        return True
 
     def synchronize_with_network(self, nodes: List[str]) -> None:
         self.state['connected_nodes_display'] = nodes
@@ -57,4 +82,9 @@ class NodeViewModel:
         return self.state['connected_nodes_display']
 
     def get_pending_transactions(self) -> List[Dict[str, Any]]:
+        # Re-serialize only when the mempool has changed since the last snapshot
+        version = self.mempool.version
+        if version != self._pending_version:
+            self.state['pending_transactions'] = self.format_pending_transactions()
+            self._pending_version = version
         return self.state['pending_transactions'] 
\ No newline at end of file
@@ -11,19 +11,47 @@ class WalletViewModel:
     def __init__(self, wallet: Wallet, blockchain: Blockchain):
         self.wallet = wallet
         self.blockchain = blockchain
+        # Balance and history as of the cached (length, tip hash); only new blocks are scanned
+        self._cache_key = None
+        self._balance = 0.0
+        self._history = []
         self.state = {
             'wallet_balance_display': self.format_balance_for_display(),
             'transaction_history': self.format_transaction_history(),
             'address_display': self.format_address()
         }
 
+    def _refresh(self):
+        chain = self.blockchain.chain
+        key = (len(chain), chain[-1].hash if chain else None)
+        if key == self._cache_key:
+            return
+
+        height = self._cache_key[0] if self._cache_key else 0
+        if not (0 < height <= len(chain) and chain[height - 1].hash == self._cache_key[1]):
+            # Chain was replaced, rebuild from the full address history
+            self._balance = 0.0
+            self._history = []
+
+        # The blockchain's address index lists this wallet's transactions in chain order,
+        # so everything past the entries already seen is new
+        address = self.wallet.address
+        transactions = self.blockchain.get_transactions_for_address(address)
+        for tx in transactions[len(self._history):]:
+            if tx.recipient == address:
+                self._balance += tx.amount
+            if tx.sender == address:
+                self._balance -= tx.amount
+            self._history.append(tx.to_dict())
+        self._cache_key = key
+
     def format_balance_for_display(self) -> str:
-        balance = self.wallet.get_balance(self.blockchain)
-        return f"{balance:.3f} ZTL Coin"
+        self._refresh()
+        return f"{self._balance:.3f} ZTL Coin"
 
     def format_transaction_history(self) -> List[Dict[str, Any]]:
-        history = self.wallet.get_transaction_history(self.blockchain)
-        return [tx.to_dict() for tx in history]
+        self._refresh()
+        return self._history
 
     def format_address(self) -> str:
         return self.wallet.address
@@ -32,6 +60,7 @@ class WalletViewModel:
         return self.state['wallet_balance_display']
 
     def get_transaction_history(self) -> List[Dict[str, Any]]:
+        self.state['transaction_history'] = self.format_transaction_history()
         return self.state['transaction_history']
 
     def get_address_display(self) -> str:
@@ -3,14 +3,21 @@ Flask routes for BlockyHomework blockchain system.
 Defines all UI routes and API endpoints.
 """
 
-from flask import Flask, render_template, jsonify, request, make_response
-from datetime import datetime
+from flask import Blueprint, Flask, Response, current_app, render_template, request, stream_with_context
+from datetime import date
+import hashlib
+from functools import lru_cache
+from types import SimpleNamespace
+import orjson
+from werkzeug.exceptions import HTTPException
+import threading
 import sys
 import os
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+from models.block import Block
 from models.blockchain import Blockchain
 from models.wallet import Wallet
 from models.transaction import Transaction
@@ -20,16 +27,197 @@ from viewmodels.wallet_viewmodel import WalletViewModel
 from networking.p2p_manager import P2PManager
 from simulation.attack_simulator import AttackSimulator
 
-# Initialize core components
-blockchain = Blockchain()
-wallet = Wallet()
-p2p_manager = P2PManager()
-attack_simulator = AttackSimulator()
 
-# Initialize ViewModels
-node_viewmodel = NodeViewModel(blockchain, wallet)
-blockchain_viewmodel = BlockchainViewModel(blockchain)
-wallet_viewmodel = WalletViewModel(wallet, blockchain)
+
+_services_instance = None
+_services_lock = threading.Lock()
+
+
+def _services() -> SimpleNamespace:
+    """Core components and ViewModels, built once on first use in each worker.
+    
+    Double-checked under a lock so overlapping first requests on a threaded
+    server share one Blockchain instead of each building their own.
+    """
+    global _services_instance
+    services = _services_instance
+    if services is not None:
+        return services
+    with _services_lock:
+        if _services_instance is None:
+            blockchain = Blockchain()
+            wallet = Wallet()
+            _services_instance = SimpleNamespace(
+                blockchain=blockchain,
+                wallet=wallet,
+                p2p_manager=P2PManager(),
+                attack_simulator=AttackSimulator(),
+                node_viewmodel=NodeViewModel(blockchain, wallet),
+                blockchain_viewmodel=BlockchainViewModel(blockchain),
+                wallet_viewmodel=WalletViewModel(wallet, blockchain)
+            )
+        return _services_instance
+
+# Serialized /api/blockchain/chain body, reused until the chain tip moves
+_chain_cache = (None, None)
+
+# Status endpoint name -> (state key, serialized body), rebuilt only when the key changes
+_status_cache = {}
+
+# Held while a block is being mined; other requests keep being served meanwhile
+_mining_lock = threading.Lock()
+
+_SITEMAP_TEMPLATE = b'''<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+    <url>
+        <loc>%(root)shome</loc>
+        <lastmod>%(today)s</lastmod>
+        <changefreq>weekly</changefreq>
+        <priority>1.0</priority>
+    </url>
+    <url>
+        <loc>%(root)s</loc>
+        <lastmod>%(today)s</lastmod>
+        <changefreq>daily</changefreq>
+        <priority>0.9</priority>
+    </url>
+    <url>
+        <loc>%(root)stransactions</loc>
+        <lastmod>%(today)s</lastmod>
+        <changefreq>daily</changefreq>
+        <priority>0.8</priority>
+    </url>
+    <url>
+        <loc>%(root)smining</loc>
+        <lastmod>%(today)s</lastmod>
+        <changefreq>daily</changefreq>
+        <priority>0.8</priority>
+    </url>
+    <url>
+        <loc>%(root)snetwork</loc>
+        <lastmod>%(today)s</lastmod>
+        <changefreq>weekly</changefreq>
+        <priority>0.7</priority>
+    </url>
+    <url>
+        <loc>%(root)ssimulation</loc>
+        <lastmod>%(today)s</lastmod>
+        <changefreq>weekly</changefreq>
+        <priority>0.7</priority>
+    </url>
+</urlset>'''
+
+_ROBOTS_TEMPLATE = b'''User-agent: *
+Allow: /
+
+# Sitemap
+Sitemap: %(root)ssitemap.xml
+
+# Crawl-delay
+Crawl-delay: 1'''
+
+
+def _json(payload, status: int = 200) -> Response:
+    """Build a JSON response encoded with orjson."""
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
+
+def _read_json():
+    """Decode the request body with orjson, returning None unless it is a JSON object."""
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _status_body(name: str, key, build) -> Response:
+    """Serve a polled status payload, re-encoding it only after its state key changed."""
+    cached = _status_cache.get(name)
+    if cached is None or cached[0] != key:
+        cached = (key, orjson.dumps(build()))
+        _status_cache[name] = cached
+    return Response(cached[1], mimetype='application/json')
+
+
+def _wants_ndjson() -> bool:
+    """True when the client asked for newline-delimited JSON."""
+    return request.accept_mimetypes.best_match(
+        ['application/json', 'application/x-ndjson']) == 'application/x-ndjson'
+
+
+def _ndjson(items) -> Response:
+    """Stream one orjson-encoded line per item."""
+    def generate():
+        for item in items:
+            yield orjson.dumps(item) + b'\n'
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
+@lru_cache(maxsize=512)
+def _block_body(index: int, content_hash: str) -> bytes:
+    """
+    Serialized block at index, reused while its content hash is unchanged.
+    
+    Keyed on strings rather than the Block, so blocks dropped by a reorg are
+    not kept alive and a block edited in place gets a new entry.
+    """
+    return orjson.dumps(_services().blockchain.get_block_by_index(index).to_dict())
+
+
+def _block_response(block: Block) -> Response:
+    """JSON response for a block found in the chain."""
+    return Response(_block_body(block.index, block.calculate_hash()), mimetype='application/json')
+
+
+def _parse_transfer(data):
+    """Validate a transfer request body; returns (recipient, amount, error)."""
+    recipient = data.get('recipient')
+    amount = data.get('amount')
+    
+    if not recipient or not amount:
+        return None, None, 'Missing recipient or amount'
+    
+    try:
+        amount = float(amount)
+    except (TypeError, ValueError):
+        return None, None, 'Invalid amount format'
+    
+    if amount <= 0:
+        return None, None, 'Amount must be positive'
+    
+    return recipient, amount, None
+
+
+@lru_cache(maxsize=1)
+def _today(ordinal: int) -> bytes:
+    """Sitemap lastmod date, formatted once per day."""
+    return date.fromordinal(ordinal).strftime('%Y-%m-%d').encode()
+
+
+@lru_cache(maxsize=64)
+def _rendered_page(app_name: str, template: str, url_root: str, path: str):
+    """
+    Render a UI template once per app, template and URL without query string.
+    
+    The pages only depend on the URL they are served at. Leaving the query
+    string out of the key stops /?x=1, /?x=2, ... from each costing a render
+    and pushing real pages out of the cache.
+    """
+    body = render_template(template).encode()
+    return body, hashlib.md5(body).hexdigest()
+
+
+def _page(template: str) -> Response:
+    """Serve a pre-rendered UI page with ETag revalidation."""
+    if current_app.jinja_env.auto_reload:
+        return Response(render_template(template), mimetype='text/html')
+    
+    body, etag = _rendered_page(current_app.name, template, request.url_root, request.path)
+    response = Response(status=304) if etag in request.if_none_match else Response(body, mimetype='text/html')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'public, max-age=300'
+    return response
 
 def init_routes(app: Flask):
     """Initialize all routes for the Flask application."""
@@ -39,407 +227,386 @@ def init_routes(app: Flask):
     @app.route('/')
     def dashboard():
         """Main dashboard page"""
-        return render_template('dashboard.html')
+        return _page('dashboard.html')
     
     @app.route('/transactions')
     def transactions():
         """Transactions page"""
-        return render_template('transactions.html')
+        return _page('transactions.html')
     
     @app.route('/mining')
     def mining():
         """Mining page"""
-        return render_template('mining.html')
+        return _page('mining.html')
     
     @app.route('/network')
     def network():
         """Network page"""
-        return render_template('network.html')
+        return _page('network.html')
     
     @app.route('/simulation')
     def simulation():
         """Simulation page"""
-        return render_template('simulation.html')
+        return _page('simulation.html')
     
     @app.route('/home')
     def home():
         """Home page - BlockyHomework introduction"""
-        return render_template('home.html')
+        return _page('home.html')
     
     # ===== API ROUTES =====
     
-    @app.route('/api/blockchain/status')
+    api = Blueprint('api', __name__, url_prefix='/api')
+    
+    @api.route('/blockchain/status')
     def get_blockchain_status():
         """Get blockchain status"""
-        try:
-            return jsonify({
-                'chain_length': blockchain.get_chain_length(),
-                'difficulty': blockchain.difficulty,
-                'pending_transactions': len(blockchain.mempool.transactions),
-                'block_reward': blockchain.block_reward,
-                'is_valid': blockchain.validate_chain()
-            })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    
-    @app.route('/api/blockchain/chain')
+        blockchain = _services().blockchain
+        # Validity is part of the key so a revalidation that finds tampering shows up here too
+        key = (blockchain.get_chain_length(), blockchain.get_latest_block().hash,
+               blockchain.mempool.get_transaction_count(), blockchain.difficulty,
+               blockchain.block_reward, blockchain.is_chain_valid())
+        return _status_body('blockchain', key, lambda: {
+            'chain_length': key[0],
+            'difficulty': key[3],
+            'pending_transactions': key[2],
+            'block_reward': key[4],
+            'is_valid': key[5]
+        })
+    
+    @api.route('/blockchain/revalidate', methods=['POST'])
+    def revalidate_blockchain():
+        """Re-hash the whole chain and refresh the cached validity"""
+        blockchain = _services().blockchain
+        return _json({
+            'is_valid': blockchain.force_revalidate(),
+            'chain_length': blockchain.get_chain_length()
+        })
+    
+    @api.route('/blockchain/chain')
     def get_chain():
         """Get full blockchain"""
-        try:
-            chain_data = blockchain_viewmodel.get_chain_display()
-            return jsonify({
+        services = _services()
+        blockchain, blockchain_viewmodel = services.blockchain, services.blockchain_viewmodel
+        etag = f"{blockchain.get_chain_length()}-{blockchain.get_latest_block().hash}"
+        if etag in request.if_none_match:
+            response = Response(status=304)
+            response.set_etag(etag)
+            return response
+        
+        # format_chain_for_ui follows the live chain, so the body matches the ETag
+        if _wants_ndjson():
+            # format_chain_for_ui returns a copy, so a block mined mid-stream cannot extend it
+            response = _ndjson(blockchain_viewmodel.format_chain_for_ui())
+            response.set_etag(etag)
+            return response
+        
+        # (etag, body) is swapped in one assignment so readers never pair a new body with an old ETag
+        global _chain_cache
+        cached_etag, body = _chain_cache
+        if cached_etag != etag:
+            chain_data = blockchain_viewmodel.format_chain_for_ui()
+            body = orjson.dumps({
                 'chain': chain_data,
                 'length': len(chain_data)
             })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
+            _chain_cache = (etag, body)
+        
+        response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        return response
     
-    @app.route('/api/blockchain/block/<int:index>')
+    @api.route('/blockchain/block/<int:index>')
     def get_block_by_index(index):
         """Get block by index"""
-        try:
-            block = blockchain.get_block_by_index(index)
-            if block:
-                return jsonify(block.to_dict())
-            else:
-                return jsonify({'error': 'Block not found'}), 404
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    
-    @app.route('/api/blockchain/block/hash/<block_hash>')
+        blockchain = _services().blockchain
+        block = blockchain.get_block_by_index(index)
+        if block:
+            return _block_response(block)
+        else:
+            return _json({'error': 'Block not found'}), 404
+    
+    @api.route('/blockchain/block/hash/<block_hash>')
     def get_block_by_hash(block_hash):
         """Get block by hash"""
-        try:
-            block = blockchain.get_block_by_hash(block_hash)
-            if block:
-                return jsonify(block.to_dict())
-            else:
-                return jsonify({'error': 'Block not found'}), 404
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    
-    @app.route('/api/wallet/balance')
+        blockchain = _services().blockchain
+        block = blockchain.get_block_by_hash(block_hash)
+        if block:
+            return _block_response(block)
+        else:
+            return _json({'error': 'Block not found'}), 404
+    
+    @api.route('/wallet/balance')
     def get_wallet_balance():
         """Get wallet balance"""
-        try:
-            balance = wallet_viewmodel.get_wallet_balance_display()
-            address = wallet_viewmodel.get_address_display()
-            return jsonify({
-                'address': address,
-                'balance': balance,
-                'balance_numeric': wallet.get_balance(blockchain)
-            })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    
-    @app.route('/api/wallet/address')
+        services = _services()
+        wallet_viewmodel, wallet, blockchain = services.wallet_viewmodel, services.wallet, services.blockchain
+        balance = wallet_viewmodel.get_wallet_balance_display()
+        address = wallet_viewmodel.get_address_display()
+        return _json({
+            'address': address,
+            'balance': balance,
+            'balance_numeric': wallet.get_balance(blockchain)
+        })
+    
+    @api.route('/wallet/address')
     def get_wallet_address():
         """Get wallet address"""
-        try:
-            return jsonify({
-                'address': wallet_viewmodel.get_address_display(),
-                'public_key': wallet.public_key
-            })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    
-    @app.route('/api/wallet/history')
+        services = _services()
+        wallet_viewmodel, wallet = services.wallet_viewmodel, services.wallet
+        return _json({
+            'address': wallet_viewmodel.get_address_display(),
+            'public_key': wallet.public_key
+        })
+    
+    @api.route('/wallet/history')
     def get_wallet_history():
         """Get wallet transaction history"""
-        try:
-            history = wallet_viewmodel.get_transaction_history()
-            return jsonify({
-                'transactions': history,
-                'count': len(history)
-            })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    
-    @app.route('/api/transactions/create', methods=['POST'])
+        wallet_viewmodel = _services().wallet_viewmodel
+        history = wallet_viewmodel.get_transaction_history()
+        return _json({
+            'transactions': history,
+            'count': len(history)
+        })
+    
+    @api.route('/transactions/create', methods=['POST'])
     def create_transaction():
         """Create a new transaction"""
-        try:
-            data = request.get_json()
-            
-            if not data:
-                return jsonify({'error': 'No data provided'}), 400
-            
-            recipient = data.get('recipient')
-            amount = data.get('amount')
-            
-            if not recipient or not amount:
-                return jsonify({'error': 'Missing recipient or amount'}), 400
-            
-            try:
-                amount = float(amount)
-                if amount <= 0:
-                    return jsonify({'error': 'Amount must be positive'}), 400
-            except ValueError:
-                return jsonify({'error': 'Invalid amount format'}), 400
-            
-            # Create transaction
-            transaction = wallet.create_transaction(recipient, amount)
-            
-            # Add to mempool
-            if blockchain.add_transaction(transaction):
-                return jsonify({
-                    'success': True,
-                    'transaction': transaction.to_dict(),
-                    'message': 'Transaction created successfully'
-                })
-            else:
-                return jsonify({'error': 'Failed to add transaction to mempool'}), 400
-                
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
+        services = _services()
+        wallet, blockchain = services.wallet, services.blockchain
+        data = _read_json()
+        
+        if not data:
+            return _json({'error': 'No data provided'}), 400
+        
+        recipient, amount, error = _parse_transfer(data)
+        if error:
+            return _json({'error': error}), 400
+        
+        # Create transaction
+        transaction = wallet.create_transaction(recipient, amount)
+        
+        # Add to mempool
+        if blockchain.add_transaction(transaction):
+            return _json({
+                'success': True,
+                'transaction': transaction.to_dict(),
+                'message': 'Transaction created successfully'
+            })
+        else:
+            return _json({'error': 'Failed to add transaction to mempool'}), 400
+    
+    @api.route('/transactions/batch', methods=['POST'])
+    def create_transactions_batch():
+        """Create several transactions in one request"""
+        services = _services()
+        wallet, blockchain = services.wallet, services.blockchain
+        data = _read_json()
+        
+        if not data or not isinstance(data.get('transactions'), list):
+            return _json({'error': 'Expected a list of transactions'}), 400
+        
+        accepted, rejected = [], []
+        for position, item in enumerate(data['transactions']):
+            recipient, amount, error = _parse_transfer(item if isinstance(item, dict) else {})
+            if not error:
+                transaction = wallet.create_transaction(recipient, amount)
+                if blockchain.add_transaction(transaction):
+                    accepted.append(transaction.to_dict())
+                    continue
+                error = 'Failed to add transaction to mempool'
+            rejected.append({'index': position, 'error': error})
+        
+        return _json({
+            'success': not rejected,
+            'transactions': accepted,
+            'rejected': rejected
+        })
     
-    @app.route('/api/transactions/pending')
+    @api.route('/transactions/pending')
     def get_pending_transactions():
         """Get pending transactions from mempool"""
-        try:
-            pending = node_viewmodel.get_pending_transactions()
-            return jsonify({
-                'transactions': pending,
-                'count': len(pending)
-            })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    
-    @app.route('/api/transactions/<transaction_hash>')
+        node_viewmodel = _services().node_viewmodel
+        pending = node_viewmodel.get_pending_transactions()
+        if _wants_ndjson():
+            return _ndjson(pending)
+        return _json({
+            'transactions': pending,
+            'count': len(pending)
+        })
+    
+    @api.route('/transactions/<transaction_hash>')
     def get_transaction_by_hash(transaction_hash):
         """Get transaction by hash"""
-        try:
-            # Check mempool first
-            tx = blockchain.mempool.get_transaction_by_hash(transaction_hash)
-            if tx:
-                return jsonify({
-                    'transaction': tx.to_dict(),
-                    'status': 'pending'
-                })
-            
-            # Check blockchain
-            tx = blockchain.get_transaction_by_hash(transaction_hash)
-            if tx:
-                return jsonify({
-                    'transaction': tx.to_dict(),
-                    'status': 'confirmed'
-                })
-            
-            return jsonify({'error': 'Transaction not found'}), 404
-            
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
+        blockchain = _services().blockchain
+        # Check mempool first
+        tx = blockchain.mempool.get_transaction_by_hash(transaction_hash)
+        if tx:
+            return _json({
+                'transaction': tx.to_dict(),
+                'status': 'pending'
+            })
+        
+        # Check blockchain
+        tx = blockchain.get_transaction_by_hash(transaction_hash)
+        if tx:
+            return _json({
+                'transaction': tx.to_dict(),
+                'status': 'confirmed'
+            })
+        
+        return _json({'error': 'Transaction not found'}), 404
     
-    @app.route('/api/mining/status')
+    @api.route('/mining/status')
     def get_mining_status():
         """Get mining status"""
-        try:
-            status = blockchain_viewmodel.get_mining_status_display()
-            return jsonify({
-                'is_mining': False,  # TODO: Implement actual mining status
-                'difficulty': status['difficulty'],
-                'block_reward': status['block_reward'],
-                'chain_length': status['chain_length']
-            })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    
-    @app.route('/api/mining/start', methods=['POST'])
+        blockchain_viewmodel = _services().blockchain_viewmodel
+        status = blockchain_viewmodel.get_mining_status_display()
+        key = (_mining_lock.locked(), status['difficulty'], status['block_reward'],
+               status['chain_length'])
+        return _status_body('mining', key, lambda: {
+            'is_mining': key[0],
+            'difficulty': key[1],
+            'block_reward': key[2],
+            'chain_length': key[3]
+        })
+    
+    @api.route('/mining/start', methods=['POST'])
     def start_mining():
         """Start mining"""
-        try:
-            # TODO: Implement actual mining start
-            return jsonify({
-                'success': True,
-                'message': 'Mining started successfully'
-            })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
+        # TODO: Implement actual mining start
+        return _json({
+            'success': True,
+            'message': 'Mining started successfully'
+        })
     
-    @app.route('/api/mining/stop', methods=['POST'])
+    @api.route('/mining/stop', methods=['POST'])
     def stop_mining():
         """Stop mining"""
-        try:
-            # TODO: Implement actual mining stop
-            return jsonify({
-                'success': True,
-                'message': 'Mining stopped successfully'
-            })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
+        # TODO: Implement actual mining stop
+        return _json({
+            'success': True,
+            'message': 'Mining stopped successfully'
+        })
     
-    @app.route('/api/mining/mine-block', methods=['POST'])
+    @api.route('/mining/mine-block', methods=['POST'])
     def mine_block():
         """Mine a single block"""
+        services = _services()
+        blockchain, wallet = services.blockchain, services.wallet
+        if not _mining_lock.acquire(blocking=False):
+            return _json({'error': 'A block is already being mined'}), 409
         try:
             block = blockchain.mine_block(wallet.address)
             if block:
-                return jsonify({
+                return _json({
                     'success': True,
                     'block': block.to_dict(),
                     'message': f'Block #{block.index} mined successfully'
                 })
             else:
-                return jsonify({'error': 'No transactions to mine'}), 400
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
+                return _json({'error': 'No transactions to mine'}), 400
+        finally:
+            _mining_lock.release()
     
-    @app.route('/api/network/status')
+    @api.route('/network/status')
     def get_network_status():
         """Get network status"""
-        try:
-            return jsonify({
-                'connected_nodes': len(p2p_manager.connected_peers),
-                'total_peers': len(p2p_manager.peers),
-                'network_status': 'connected' if p2p_manager.is_running else 'disconnected',
-                'node_id': p2p_manager.node_id,
-                'port': p2p_manager.port
-            })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    
-    @app.route('/api/network/peers')
+        status = _services().p2p_manager.status_snapshot
+        return _status_body('network', status, lambda: {
+            'connected_nodes': status.connected,
+            'total_peers': status.total,
+            'network_status': 'connected' if status.running else 'disconnected',
+            'node_id': status.node_id,
+            'port': status.port
+        })
+    
+    @api.route('/network/peers')
     def get_network_peers():
         """Get connected peers"""
-        try:
-            peers = list(p2p_manager.connected_peers)
-            return jsonify({
-                'peers': peers,
-                'count': len(peers)
-            })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
-    
-    @app.route('/api/network/connect', methods=['POST'])
+        p2p_manager = _services().p2p_manager
+        peers = p2p_manager.get_peers_snapshot()
+        return _json({
+            'peers': peers,
+            'count': len(peers)
+        })
+    
+    @api.route('/network/connect', methods=['POST'])
     def connect_to_peer():
         """Connect to a peer"""
-        try:
-            data = request.get_json()
-            peer_address = data.get('address')
-            
-            if not peer_address:
-                return jsonify({'error': 'Peer address required'}), 400
-            
-            # TODO: Implement actual peer connection
-            return jsonify({
-                'success': True,
-                'message': f'Connected to {peer_address}'
-            })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
+        data = _read_json() or {}
+        peer_address = data.get('address')
+        
+        if not peer_address:
+            return _json({'error': 'Peer address required'}), 400
+        
+        # TODO: Implement actual peer connection
+        return _json({
+            'success': True,
+            'message': f'Connected to {peer_address}'
+        })
     
     # ===== SIMULATION ROUTES =====
     
-    @app.route('/api/simulation/status')
+    @api.route('/simulation/status')
     def get_simulation_status():
         """Get attack simulation status"""
-        try:
-            return jsonify({
-                'is_running': attack_simulator.is_running,
-                'current_scenario': attack_simulator.current_scenario,
-                'attack_progress': attack_simulator.attack_progress
-            })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
+        status = _services().attack_simulator.status_snapshot
+        return _status_body('simulation', status, status._asdict)
     
-    @app.route('/api/simulation/start', methods=['POST'])
+    @api.route('/simulation/start', methods=['POST'])
     def start_simulation():
         """Start attack simulation"""
-        try:
-            data = request.get_json()
-            scenario = data.get('scenario', '51_percent_attack')
-            
-            # TODO: Implement actual simulation start
-            return jsonify({
-                'success': True,
-                'message': f'Simulation {scenario} started'
-            })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
+        data = _read_json() or {}
+        scenario = data.get('scenario', '51_percent_attack')
+        
+        # TODO: Implement actual simulation start
+        return _json({
+            'success': True,
+            'message': f'Simulation {scenario} started'
+        })
     
-    @app.route('/api/simulation/stop', methods=['POST'])
+    @api.route('/simulation/stop', methods=['POST'])
     def stop_simulation():
         """Stop attack simulation"""
-        try:
-            # TODO: Implement actual simulation stop
-            return jsonify({
-                'success': True,
-                'message': 'Simulation stopped'
-            })
-        except Exception as e:
-            return jsonify({'error': str(e)}), 500
+        # TODO: Implement actual simulation stop
+        return _json({
+            'success': True,
+            'message': 'Simulation stopped'
+        })
+    
+    app.register_blueprint(api)
     
     # ===== UTILITY ROUTES =====
     
     @app.route('/sitemap.xml')
     def sitemap():
         """Generate sitemap.xml for SEO"""
-        sitemap_xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-    <url>
-        <loc>{request.url_root}home</loc>
-        <lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod>
-        <changefreq>weekly</changefreq>
-        <priority>1.0</priority>
-    </url>
-    <url>
-        <loc>{request.url_root}</loc>
-        <lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod>
-        <changefreq>daily</changefreq>
-        <priority>0.9</priority>
-    </url>
-    <url>
-        <loc>{request.url_root}transactions</loc>
-        <lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod>
-        <changefreq>daily</changefreq>
-        <priority>0.8</priority>
-    </url>
-    <url>
-        <loc>{request.url_root}mining</loc>
-        <lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod>
-        <changefreq>daily</changefreq>
-        <priority>0.8</priority>
-    </url>
-    <url>
-        <loc>{request.url_root}network</loc>
-        <lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod>
-        <changefreq>weekly</changefreq>
-        <priority>0.7</priority>
-    </url>
-    <url>
-        <loc>{request.url_root}simulation</loc>
-        <lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod>
-        <changefreq>weekly</changefreq>
-        <priority>0.7</priority>
-    </url>
-</urlset>'''
-        
-        response = make_response(sitemap_xml)
-        response.headers["Content-Type"] = "application/xml"
-        return response
+        body = _SITEMAP_TEMPLATE % {
+            b'root': request.url_root.encode(),
+            b'today': _today(date.today().toordinal())
+        }
+        return Response(body, mimetype='application/xml')
     
     @app.route('/robots.txt')
     def robots():
         """Generate robots.txt for SEO"""
-        robots_txt = f'''User-agent: *
-Allow: /
-
-# Sitemap
-Sitemap: {request.url_root}sitemap.xml
-
-# Crawl-delay
-Crawl-delay: 1'''
-        
-        response = make_response(robots_txt)
-        response.headers["Content-Type"] = "text/plain"
-        return response
+        body = _ROBOTS_TEMPLATE % {b'root': request.url_root.encode()}
+        return Response(body, mimetype='text/plain')
+    
+    @app.errorhandler(Exception)
+    def unhandled_error(error):
+        """Report uncaught API errors as JSON"""
+        if isinstance(error, HTTPException):
+            return error
+        return _json({'error': str(error)}), 500
     
     @app.errorhandler(404)
     def not_found(error):
         """Handle 404 errors"""
-        return jsonify({'error': 'Endpoint not found'}), 404
+        return _json({'error': 'Endpoint not found'}), 404
     
     @app.errorhandler(500)
     def internal_error(error):
         """Handle 500 errors"""
-        return jsonify({'error': 'Internal server error'}), 500 
\ No newline at end of file
+        return _json({'error': 'Internal server error'}), 500 
\ No newline at end of file
@@ -6,34 +6,71 @@ Tests complete system integration including ViewModels, networking, and simulati
 import unittest
 import time
 import json
+import pickle
+import numpy as np
 from unittest.mock import Mock, patch, MagicMock
 
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from models.block import Block
 from models.blockchain import Blockchain
 from models.wallet import Wallet
 from models.transaction import Transaction
 from viewmodels.node_viewmodel import NodeViewModel
 from viewmodels.blockchain_viewmodel import BlockchainViewModel
 from viewmodels.wallet_viewmodel import WalletViewModel
-from simulation.attack_simulator import AttackSimulator
-from simulation.scenario_generator import ScenarioGenerator, AttackType
+from simulation.attack_simulator import AttackSimulator, _solve_block
+from simulation.scenario_generator import ScenarioGenerator, AttackType, SimulationResult
+
+# Proof-of-work difficulty for test chains; one leading zero needs ~16 hashes per block
+TEST_DIFFICULTY = 1
+
+
+def _mine_empty_fork(fixture_blob: bytes, count: int) -> list:
+    """Mine count empty blocks on a private copy of a pickled (blockchain, wallet) fixture."""
+    blockchain, _ = pickle.loads(fixture_blob)
+    for _ in range(count):
+        previous = blockchain.get_latest_block()
+        block = Block(previous.index + 1, [], 0, previous.hash)
+        block.mine_proof_of_work(blockchain.difficulty)
+        blockchain.chain.append(block)
+    return blockchain.chain
+
+
+def _make_scenarios(generator, name, count, base_power=50, step=10,
+                    attack_type=AttackType.FIFTY_ONE_PERCENT):
+    """Short custom scenarios named f"{name} {i}" with attack power rising by step."""
+    return [
+        generator.create_custom_scenario(
+            name=f"{name} {i}",
+            attack_type=attack_type,
+            description=f"{name} {i}",
+            attack_power=base_power + i * step,
+            duration=1,
+            network_size=50
+        )
+        for i in range(count)
+    ]
 
 
 class TestSystemIntegration(unittest.TestCase):
     """Integration tests for the complete system."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the genesis chain and wallet once; each test unpickles a fresh copy."""
+        blockchain = Blockchain()
+        blockchain.difficulty = TEST_DIFFICULTY
+        cls._fixture_blob = pickle.dumps((blockchain, Wallet()))
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.blockchain = Blockchain()
-        self.wallet = Wallet()
+        self.blockchain, self.wallet = pickle.loads(self._fixture_blob)
         self.node_viewmodel = NodeViewModel(self.blockchain, self.wallet)
         self.blockchain_viewmodel = BlockchainViewModel(self.blockchain)
         self.wallet_viewmodel = WalletViewModel(self.wallet, self.blockchain)
-        self.attack_simulator = AttackSimulator()
-        self.scenario_generator = ScenarioGenerator()
     
     def test_complete_transaction_flow(self):
         """Test complete transaction flow from creation to mining."""
@@ -68,9 +105,10 @@ class TestSystemIntegration(unittest.TestCase):
         # Create two blockchains
         blockchain1 = Blockchain()
         blockchain2 = Blockchain()
+        blockchain1.difficulty = TEST_DIFFICULTY
         
         # Add transactions and mine blocks on first blockchain
-        wallet1 = Wallet()
+        wallet1 = self.wallet
         for i in range(3):
             transaction = wallet1.create_transaction("recipient", 10.0)
             blockchain1.add_transaction(transaction)
@@ -106,84 +144,23 @@ class TestSystemIntegration(unittest.TestCase):
         self.assertNotEqual(len(initial_chain_length), len(updated_chain_length))
         self.assertNotEqual(initial_balance, updated_balance)
     
-    def test_attack_simulation_integration(self):
-        """Test attack simulation integration."""
-        # Create a basic 51% attack scenario
-        scenario = self.scenario_generator.create_custom_scenario(
-            name="Test 51% Attack",
-            attack_type=AttackType.FIFTY_ONE_PERCENT,
-            description="Test attack for integration",
-            attack_power=60,
-            duration=1,  # Short duration for testing
-            network_size=50
-        )
-        
-        # Run the scenario
-        result = self.scenario_generator.run_scenario(scenario)
-        
-        # Verify results
-        self.assertIsNotNone(result)
-        self.assertIsInstance(result.success, bool)
-        self.assertIsInstance(result.metrics, dict)
-        self.assertIsInstance(result.duration, float)
-        self.assertGreater(result.duration, 0)
-    
-    def test_multiple_scenario_execution(self):
-        """Test execution of multiple scenarios."""
-        scenarios = []
-        
-        # Create multiple scenarios
-        for i in range(3):
-            scenario = self.scenario_generator.create_custom_scenario(
-                name=f"Test Scenario {i}",
-                attack_type=AttackType.FIFTY_ONE_PERCENT,
-                description=f"Test scenario {i}",
-                attack_power=50 + i * 10,
-                duration=1,
-                network_size=50
-            )
-            scenarios.append(scenario)
-        
-        # Run all scenarios
-        results = self.scenario_generator.run_scenario_batch(scenarios)
-        
-        # Verify results
-        self.assertEqual(len(results), 3)
-        for result in results:
-            self.assertIsNotNone(result)
-            self.assertIsInstance(result.success, bool)
-    
-    def test_comparison_report_generation(self):
-        """Test comparison report generation."""
-        # Create and run multiple scenarios
-        scenarios = []
-        for i in range(2):
-            scenario = self.scenario_generator.create_custom_scenario(
-                name=f"Comparison Test {i}",
-                attack_type=AttackType.FIFTY_ONE_PERCENT,
-                description=f"Comparison test {i}",
-                attack_power=55 + i * 5,
-                duration=1,
-                network_size=50
-            )
-            scenarios.append(scenario)
-        
-        results = self.scenario_generator.run_scenario_batch(scenarios)
-        
-        # Generate comparison report
-        report = self.scenario_generator.generate_comparison_report(results)
-        
-        # Verify report structure
-        self.assertIn('summary', report)
-        self.assertIn('attack_type_analysis', report)
-        self.assertIn('detailed_results', report)
-        self.assertIn('recommendations', report)
-        
-        # Verify summary data
-        summary = report['summary']
-        self.assertEqual(summary['total_scenarios'], 2)
-        self.assertIn('success_rate', summary)
-        self.assertIn('avg_duration', summary)
+    def test_viewmodel_lists_are_snapshots(self):
+        """Test formatted lists handed out are unaffected by later blocks or caller edits."""
+        chain_display = self.blockchain_viewmodel.format_chain_for_ui()
+        transaction_list = self.blockchain_viewmodel.format_transaction_list()
+        chain_display.clear()
+        transaction_list.append({'hash': 'bogus'})
+        
+        self.assertEqual(len(self.blockchain_viewmodel.format_chain_for_ui()), 1)
+        self.assertEqual(len(self.blockchain_viewmodel.format_transaction_list()), 1)
+        
+        before = self.blockchain_viewmodel.format_chain_for_ui()
+        transaction = Transaction("sender", "recipient", 1.0)
+        self.blockchain.chain.append(Block(1, [transaction], 1, self.blockchain.get_latest_block().hash))
+        
+        self.assertEqual(len(before), 1)
+        self.assertEqual(len(self.blockchain_viewmodel.format_chain_for_ui()), 2)
+        self.assertEqual(len(self.blockchain_viewmodel.format_transaction_list()), 2)
     
     def test_wallet_transaction_history(self):
         """Test wallet transaction history tracking."""
@@ -257,6 +234,121 @@ class TestSystemIntegration(unittest.TestCase):
         block_data = block.to_dict()
         self.assertGreater(len(block_data['transactions']), 1)  # Including reward transaction
     
+    def test_error_handling_integration(self):
+        """Test error handling in integrated system."""
+        # Test invalid transaction creation
+        invalid_transaction = Transaction("sender", "recipient", -5.0)  # Negative amount
+        success = self.blockchain.add_transaction(invalid_transaction)
+        self.assertFalse(success)
+        
+        # Test mining with no transactions
+        block = self.blockchain.mine_block(self.wallet.address)
+        self.assertIsNone(block)
+        
+        # Test invalid wallet operations
+        with self.assertRaises(Exception):
+            # Try to create transaction with invalid recipient
+            self.wallet.create_transaction("", 10.0)
+        
+        # Test attack simulator error handling
+        # Start simulation with invalid parameters
+        attack_simulator = AttackSimulator()
+        self.addCleanup(attack_simulator.stop_simulation)
+        attack_simulator.attack_power = 0
+        success = attack_simulator.start_simulation()
+        self.assertFalse(success)  # Should fail with invalid parameters
+
+
+class TestSimulationIntegration(unittest.TestCase):
+    """Integration tests for attack simulation and scenario generation."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.attack_simulator = AttackSimulator()
+        self.scenario_generator = ScenarioGenerator()
+        # A failed assertion must not leave a simulation thread running into later tests
+        self.addCleanup(self.attack_simulator.stop_simulation)
+    
+    def test_attack_simulation_integration(self):
+        """Test attack simulation integration."""
+        # Create a basic 51% attack scenario
+        scenario = self.scenario_generator.create_custom_scenario(
+            name="Test 51% Attack",
+            attack_type=AttackType.FIFTY_ONE_PERCENT,
+            description="Test attack for integration",
+            attack_power=60,
+            duration=1,  # Short duration for testing
+            network_size=50
+        )
+        
+        # Run the scenario
+        result = self.scenario_generator.run_scenario(scenario)
+        
+        # Verify results
+        self.assertIsNotNone(result)
+        self.assertIsInstance(result.success, bool)
+        self.assertIsInstance(result.metrics, dict)
+        self.assertIsInstance(result.duration, float)
+        self.assertGreater(result.duration, 0)
+    
+    def test_multiple_scenario_execution(self):
+        """Test execution of multiple scenarios."""
+        # Create multiple scenarios
+        scenarios = _make_scenarios(self.scenario_generator, "Test Scenario", 3)
+        
+        # Run all scenarios
+        results = self.scenario_generator.run_scenario_batch(scenarios)
+        
+        # Verify results
+        self.assertEqual(len(results), 3)
+        for result in results:
+            with self.subTest(scenario=getattr(result, 'scenario_name', None)):
+                self.assertIsNotNone(result)
+                self.assertIsInstance(result.success, bool)
+        
+        # Every scenario is reported exactly once, whichever worker ran it
+        self.assertEqual(sorted(result.scenario_name for result in results),
+                         sorted(scenario.name for scenario in scenarios))
+    
+    def test_comparison_report_generation(self):
+        """Test comparison report generation."""
+        # Create and run multiple scenarios
+        scenarios = _make_scenarios(self.scenario_generator, "Comparison Test", 2,
+                                    base_power=55, step=5)
+        
+        results = self.scenario_generator.run_scenario_batch(scenarios)
+        
+        # Generate comparison report
+        report = self.scenario_generator.generate_comparison_report(results)
+        
+        # Verify report structure
+        self.assertIn('summary', report)
+        self.assertIn('attack_type_analysis', report)
+        self.assertIn('detailed_results', report)
+        self.assertIn('recommendations', report)
+        
+        # Verify summary data
+        summary = report['summary']
+        self.assertEqual(summary['total_scenarios'], 2)
+        self.assertIn('success_rate', summary)
+        self.assertIn('avg_duration', summary)
+    
+    def test_comparison_report_attack_type_order(self):
+        """Test per-attack-type analysis keeps the order types first appear in."""
+        results = [
+            SimulationResult(f"Order {i}", attack_type, i % 2 == 0,
+                             {'network_impact': 10.0 * i}, 1.0, "", {}, {})
+            for i, attack_type in enumerate(["selfish_mining", "51_percent", "selfish_mining"])
+        ]
+        
+        report = self.scenario_generator.generate_comparison_report(results)
+        
+        analysis = report['attack_type_analysis']
+        self.assertEqual(list(analysis), ["selfish_mining", "51_percent"])
+        self.assertEqual(analysis['selfish_mining']['count'], 2)
+        self.assertEqual(analysis['selfish_mining']['successful'], 2)
+        self.assertEqual(analysis['51_percent']['avg_network_impact'], 10.0)
+    
     def test_attack_simulator_metrics(self):
         """Test attack simulator metrics collection."""
         # Start a simple attack simulation
@@ -266,12 +358,13 @@ class TestSystemIntegration(unittest.TestCase):
         self.attack_simulator.network_size = 50
         
         # Run simulation
-        success = self.attack_simulator.start_simulation()
+        success = self.attack_simulator.start_simulation(
+            "51_percent", attack_power=60, duration=1, network_size=50
+        )
         self.assertTrue(success)
         
         # Wait for simulation to complete
-        while self.attack_simulator.is_running:
-            time.sleep(0.1)
+        self.assertTrue(self.attack_simulator.done_event.wait(timeout=90))
         
         # Get metrics
         metrics = self.attack_simulator.get_attack_metrics()
@@ -289,6 +382,98 @@ class TestSystemIntegration(unittest.TestCase):
         self.assertGreaterEqual(metrics['blocks_mined_legitimate'], 0)
         self.assertGreaterEqual(metrics['attack_duration_actual'], 0)
     
+    def test_attack_simulator_preview(self):
+        """Test Monte-Carlo attack preview without mining."""
+        self.attack_simulator.attack_type = "51_percent"
+        self.attack_simulator.attack_power = 60
+        self.attack_simulator.attack_duration = 1
+        
+        preview = self.attack_simulator.preview_attack(trials=200)
+        
+        # Every tick produces exactly one block in a 51% attack, after 5 warm-up blocks
+        total_blocks = preview['expected_blocks_attack'] + preview['expected_blocks_legitimate']
+        self.assertAlmostEqual(total_blocks, 65)
+        self.assertGreater(preview['expected_blocks_attack'], preview['expected_blocks_legitimate'])
+        self.assertGreaterEqual(preview['attack_win_probability'], 0)
+        self.assertLessEqual(preview['attack_win_probability'], 1)
+        self.assertFalse(self.attack_simulator.is_running)
+    
+    def test_attack_simulator_run_batch(self):
+        """Test seeded Monte-Carlo batches without running the simulation loop."""
+        self.attack_simulator.attack_power = 60
+        self.attack_simulator.attack_duration = 1
+        
+        batch = self.attack_simulator.run_batch(50, seed=7)
+        
+        self.assertEqual(len(batch['results']), 50)
+        self.assertEqual(batch['successful_attacks'],
+                         sum(result['attack_success'] for result in batch['results']))
+        self.assertEqual(batch, self.attack_simulator.run_batch(50, seed=7))
+        self.assertFalse(self.attack_simulator.is_running)
+    
+    def test_attack_simulator_preview_matches_batch(self):
+        """Test preview and batch estimate the same race, setup block included."""
+        self.attack_simulator.attack_type = "double_spend"
+        self.attack_simulator.attack_duration = 1
+        
+        batch = self.attack_simulator.run_batch(200, seed=3)
+        self.attack_simulator._rng = np.random.default_rng(3)
+        preview = self.attack_simulator.preview_attack(trials=200)
+        
+        self.assertAlmostEqual(preview['attack_win_probability'] * 100, batch['success_rate'])
+        # 3 warm-up blocks plus the block mined by the double-spend setup
+        self.assertTrue(all(result['blocks_mined_legitimate'] >= 4 for result in batch['results']))
+        self.assertTrue(all(result['double_spend_success'] == result['attack_success']
+                            for result in batch['results']))
+    
+    def test_attack_simulator_batch_withholding_spends_ticks(self):
+        """Test withheld attacker blocks use up the tick budget as the live loop's waits do."""
+        self.attack_simulator.attack_type = "selfish_mining"
+        self.attack_simulator.attack_power = 100
+        self.attack_simulator.attack_duration = 1
+        
+        batch = self.attack_simulator.run_batch(20, seed=1)
+        
+        # Every 60-tick budget fits 20 ticks of one block plus two withheld ticks each
+        self.assertTrue(all(result['blocks_mined_attack'] == 20 for result in batch['results']))
+        self.assertNotIn('double_spend_success', batch['results'][0])
+    
+    def test_attack_simulator_rejects_zero_tick_interval(self):
+        """Test Monte-Carlo estimates reject a non-positive tick interval."""
+        self.attack_simulator.tick_interval = 0
+        
+        with self.assertRaises(ValueError):
+            self.attack_simulator.preview_attack(trials=10)
+        with self.assertRaises(ValueError):
+            self.attack_simulator.run_batch(10)
+    
+    def test_solve_block_template(self):
+        """Test a block template solved from its dict appends like a locally mined block."""
+        wallet = Wallet()
+        chain = self.attack_simulator.legitimate_chain
+        chain.difficulty = TEST_DIFFICULTY
+        transaction = Transaction(wallet.public_key, "recipient_address", 5.0)
+        transaction.sign_transaction(wallet.private_key)
+        self.assertTrue(chain.add_transaction(transaction))
+        
+        block = chain.next_block_template()
+        block.proof, block.hash = _solve_block(block.to_dict(), chain.difficulty)
+        self.assertEqual(block.hash, block.calculate_hash())
+        self.assertTrue(block.hash.startswith('0' * TEST_DIFFICULTY))
+        
+        chain.append_mined_block(block, "miner")
+        self.assertIs(chain.get_latest_block(), block)
+        self.assertEqual(len(chain.mempool), 0)
+        self.assertIsNone(chain.next_block_template())
+    
+    def test_attack_simulator_report_bytes(self):
+        """Test binary simulation report round trip."""
+        report = pickle.loads(self.attack_simulator.export_simulation_report_bytes())
+        
+        self.assertEqual(report['results'], self.attack_simulator.metrics)
+        self.assertIn('chain_comparison', report)
+        self.assertIn('success_rate', report)
+    
     def test_scenario_export_import(self):
         """Test scenario export and import functionality."""
         # Create a custom scenario
@@ -331,62 +516,41 @@ class TestSystemIntegration(unittest.TestCase):
         self.assertEqual(imported_scenario.attack_type, scenario.attack_type)
         self.assertEqual(imported_scenario.attack_power, scenario.attack_power)
         self.assertEqual(imported_scenario.duration, scenario.duration)
-    
-    def test_error_handling_integration(self):
-        """Test error handling in integrated system."""
-        # Test invalid transaction creation
-        invalid_transaction = Transaction("sender", "recipient", -5.0)  # Negative amount
-        success = self.blockchain.add_transaction(invalid_transaction)
-        self.assertFalse(success)
-        
-        # Test mining with no transactions
-        block = self.blockchain.mine_block(self.wallet.address)
-        self.assertIsNone(block)
-        
-        # Test invalid wallet operations
-        with self.assertRaises(Exception):
-            # Try to create transaction with invalid recipient
-            self.wallet.create_transaction("", 10.0)
-        
-        # Test attack simulator error handling
-        # Start simulation with invalid parameters
-        self.attack_simulator.attack_power = 0
-        success = self.attack_simulator.start_simulation()
-        self.assertFalse(success)  # Should fail with invalid parameters
 
 
 class TestPerformanceIntegration(unittest.TestCase):
     """Performance integration tests."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the genesis chain and wallet once; each test unpickles a fresh copy."""
+        blockchain = Blockchain()
+        blockchain.difficulty = TEST_DIFFICULTY
+        cls._fixture_blob = pickle.dumps((blockchain, Wallet()))
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.blockchain = Blockchain()
-        self.wallet = Wallet()
+        self.blockchain, self.wallet = pickle.loads(self._fixture_blob)
     
     def test_large_transaction_processing(self):
         """Test processing of large number of transactions."""
         start_time = time.time()
         
         # Add many transactions
-        for i in range(100):
-            transaction = self.wallet.create_transaction(f"recipient_{i}", 1.0)
-            self.blockchain.add_transaction(transaction)
+        transactions = self.wallet.create_transactions(
+            [f"recipient_{i}" for i in range(100)], [1.0] * 100
+        )
+        self.blockchain.add_transactions(transactions)
         
         # Mine blocks
-        blocks_mined = 0
-        while len(self.blockchain.mempool.transactions) > 0:
-            block = self.blockchain.mine_block(self.wallet.address)
-            if block:
-                blocks_mined += 1
-            else:
-                break
+        blocks = self.blockchain.mine_until_empty(self.wallet.address)
         
         end_time = time.time()
         processing_time = end_time - start_time
         
         # Verify performance is reasonable
         self.assertLess(processing_time, 30)  # Should complete within 30 seconds
-        self.assertGreater(blocks_mined, 0)
+        self.assertGreater(len(blocks), 0)
         
         # Verify all transactions were processed
         total_transactions = sum(len(block.transactions) for block in self.blockchain.chain)
@@ -427,27 +591,54 @@ class TestPerformanceIntegration(unittest.TestCase):
         # Verify some blocks were mined
         self.assertGreater(len(results), 0)
     
+    def test_parallel_mining_merge(self):
+        """Test forks mined in separate processes merge by the longest-chain rule."""
+        from concurrent.futures import ProcessPoolExecutor
+        
+        # Each worker mines its own fork, so the PoW runs outside this process's GIL
+        with ProcessPoolExecutor(max_workers=3) as pool:
+            forks = list(pool.map(_mine_empty_fork, [self._fixture_blob] * 3, [5, 4, 3]))
+        
+        # The unsigned genesis transaction never verifies; block hashes, proofs
+        # and links are still checked
+        with patch.object(Transaction, 'is_valid', return_value=True):
+            longest = max(forks, key=len)
+            self.assertTrue(self.blockchain.replace_chain(longest))
+            self.assertEqual(len(self.blockchain.chain), 6)
+            
+            # Shorter forks no longer win
+            self.assertFalse(any(self.blockchain.replace_chain(fork) for fork in forks))
+            
+            # A longer fork with a tampered block is rejected
+            tampered = _mine_empty_fork(self._fixture_blob, 7)
+            tampered[3].proof += 1
+            self.assertFalse(self.blockchain.replace_chain(tampered))
+        
+        self.assertEqual(self.blockchain.get_latest_block().hash, longest[-1].hash)
+    
     def test_memory_usage(self):
         """Test memory usage with large blockchain."""
         import gc
-        import psutil
-        import os
+        import tracemalloc
         
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss
+        # Python allocations made by this test alone, unlike the process-wide peak RSS
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        initial_memory = tracemalloc.get_traced_memory()[0]
         
         # Create large blockchain
         for i in range(50):
-            for j in range(10):
-                transaction = self.wallet.create_transaction(f"recipient_{i}_{j}", 1.0)
-                self.blockchain.add_transaction(transaction)
+            transactions = self.wallet.create_transactions(
+                [f"recipient_{i}_{j}" for j in range(10)], [1.0] * 10
+            )
+            self.blockchain.add_transactions(transactions)
             block = self.blockchain.mine_block(self.wallet.address)
             self.assertIsNotNone(block)
         
         # Force garbage collection
         gc.collect()
         
-        final_memory = process.memory_info().rss
+        final_memory = tracemalloc.get_traced_memory()[0]
         memory_increase = final_memory - initial_memory
         
         # Verify memory usage is reasonable (less than 100MB increase)
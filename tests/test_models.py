@@ -6,6 +6,7 @@ Tests Block, Transaction, Wallet, Blockchain, and Mempool classes.
 import unittest
 import time
 import json
+import hashlib
 from unittest.mock import Mock, patch
 
 import sys
@@ -18,6 +19,15 @@ from models.wallet import Wallet
 from models.blockchain import Blockchain
 from models.mempool import Mempool
 
+# Shared by every test; Wallet holds no mutable state, so one key pair serves the module
+_WALLET = None
+
+
+def setUpModule():
+    """Generate the shared wallet's key pair once for the whole module."""
+    global _WALLET
+    _WALLET = Wallet()
+
 
 class TestBlock(unittest.TestCase):
     """Test cases for Block class."""
@@ -55,6 +65,21 @@ class TestBlock(unittest.TestCase):
         updated_hash = self.block.calculate_hash()
         self.assertNotEqual(original_hash, updated_hash)
     
+    def test_calculate_hash_tracks_transaction_edits(self):
+        """Test memoized hash is recomputed when a transaction changes."""
+        original_hash = self.block.calculate_hash()
+        self.transactions[0].amount = 99.0
+        self.assertNotEqual(original_hash, self.block.calculate_hash())
+        
+        self.transactions[0].amount = 10.0
+        self.assertEqual(original_hash, self.block.calculate_hash())
+    
+    def test_calculate_hash_tracks_type_changes(self):
+        """Test memoized hash is recomputed when an equal value changes type."""
+        original_hash = self.block.calculate_hash()
+        self.transactions[0].amount = 10
+        self.assertNotEqual(original_hash, self.block.calculate_hash())
+    
     def test_to_dict(self):
         """Test block serialization to dictionary."""
         block_dict = self.block.to_dict()
@@ -87,6 +112,10 @@ class TestBlock(unittest.TestCase):
         self.block.proof = proof
         block_hash = self.block.calculate_hash()
         self.assertTrue(block_hash.startswith('0' * difficulty))
+        
+        # The midstate-hashed nonce search must agree with hashing the full serialization
+        block_string = json.dumps(self.block.to_dict(), sort_keys=True)
+        self.assertEqual(self.block.hash, hashlib.sha256(block_string.encode()).hexdigest())
     
     def test_is_valid(self):
         """Test block validation."""
@@ -136,10 +165,36 @@ class TestTransaction(unittest.TestCase):
         updated_hash = self.transaction.calculate_hash()
         self.assertNotEqual(original_hash, updated_hash)
     
+    def test_calculate_hash_memoized(self):
+        """Test repeated hashing reuses the result until a hashed field changes."""
+        self.assertIs(self.transaction.calculate_hash(), self.transaction.calculate_hash())
+        
+        original_hash = self.transaction.calculate_hash()
+        self.transaction.amount = 25
+        self.assertNotEqual(self.transaction.calculate_hash(), original_hash)
+        self.transaction.amount = 25.5
+        self.assertEqual(self.transaction.calculate_hash(), original_hash)
+    
+    def test_calculate_hash_matches_json(self):
+        """Test hash input is identical to the sorted json.dumps serialization."""
+        for sender, amount, timestamp in [("sender_address", 25.5, 1700000000.25),
+                                          ("s\u00e9nder \"quoted\"", 3, 1700000000),
+                                          ("sender_address", 1e-7, 0.1),
+                                          ("sender_address", True, 1.0)]:
+            with self.subTest(sender=sender, amount=amount):
+                transaction = Transaction(sender, "recipient_address", amount, timestamp=timestamp)
+                expected = json.dumps({
+                    'sender': sender,
+                    'recipient': "recipient_address",
+                    'amount': amount,
+                    'timestamp': timestamp
+                }, sort_keys=True)
+                self.assertEqual(transaction.hash, hashlib.sha256(expected.encode()).hexdigest())
+    
     def test_sign_transaction(self):
         """Test transaction signing."""
         # Create a wallet for signing
-        wallet = Wallet()
+        wallet = _WALLET
         
         # Sign the transaction
         success = self.transaction.sign_transaction(wallet.private_key)
@@ -148,7 +203,7 @@ class TestTransaction(unittest.TestCase):
     
     def test_verify_signature(self):
         """Test signature verification."""
-        wallet = Wallet()
+        wallet = _WALLET
         
         # Sign and verify
         self.transaction.sign_transaction(wallet.private_key)
@@ -158,6 +213,21 @@ class TestTransaction(unittest.TestCase):
         self.transaction.signature = "invalid_signature"
         self.assertFalse(self.transaction.verify_signature())
     
+    def test_verify_signature_with_public_key_sender(self):
+        """Test an ecdsa-made signature verifies against a raw public key sender."""
+        transaction = Transaction(_WALLET.public_key, "recipient_address", 25.5)
+        self.assertTrue(transaction.sign_transaction(_WALLET.private_key))
+        self.assertTrue(transaction.verify_signature())
+        
+        # Any change to the signed fields breaks the signature
+        transaction.amount = 30.0
+        self.assertFalse(transaction.verify_signature())
+        
+        # Re-signing after the edit covers the new fields
+        self.assertTrue(transaction.sign_transaction(_WALLET.private_key))
+        self.assertTrue(transaction.verify_signature())
+        self.assertEqual(transaction.hash, transaction.calculate_hash())
+    
     def test_is_valid(self):
         """Test transaction validation."""
         # Valid transaction should pass validation
@@ -209,7 +279,7 @@ class TestWallet(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.wallet = Wallet()
+        self.wallet = _WALLET
         self.blockchain = Blockchain()
     
     def test_wallet_creation(self):
@@ -315,7 +385,7 @@ class TestBlockchain(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.blockchain = Blockchain()
-        self.wallet = Wallet()
+        self.wallet = _WALLET
     
     def test_blockchain_creation(self):
         """Test blockchain creation."""
@@ -344,7 +414,7 @@ class TestBlockchain(unittest.TestCase):
         
         success = self.blockchain.add_transaction(transaction)
         self.assertTrue(success)
-        self.assertEqual(len(self.blockchain.mempool.transactions), 1)
+        self.assertEqual(len(self.blockchain.mempool), 1)
     
     def test_mine_block(self):
         """Test block mining."""
@@ -359,7 +429,7 @@ class TestBlockchain(unittest.TestCase):
         self.assertIsNotNone(block)
         self.assertEqual(block.index, 1)
         self.assertEqual(len(self.blockchain.chain), 2)
-        self.assertEqual(len(self.blockchain.mempool.transactions), 0)  # Transactions should be cleared
+        self.assertEqual(len(self.blockchain.mempool), 0)  # Transactions should be cleared
     
     def test_mine_block_no_transactions(self):
         """Test mining with no transactions."""
@@ -368,6 +438,9 @@ class TestBlockchain(unittest.TestCase):
     
     def test_adjust_difficulty(self):
         """Test difficulty adjustment."""
+        # Each block links to the last, so mining can't be split across processes;
+        # start from one leading zero so the ten sequential PoW searches stay cheap
+        self.blockchain.difficulty = 1
         original_difficulty = self.blockchain.difficulty
         
         # Mine some blocks to trigger difficulty adjustment
@@ -395,6 +468,67 @@ class TestBlockchain(unittest.TestCase):
         # Chain should still be valid
         self.assertTrue(self.blockchain.validate_chain())
     
+    def test_is_chain_valid_cached(self):
+        """Test cached validity follows appended and tampered blocks."""
+        self.assertTrue(self.blockchain.is_chain_valid())
+        
+        for i in range(1, 4):
+            previous_hash = self.blockchain.get_latest_block().hash
+            self.blockchain.chain.append(Block(i, [], 1, previous_hash))
+        self.assertTrue(self.blockchain.is_chain_valid())
+        self.assertEqual(self.blockchain.last_validated_tip, self.blockchain.get_latest_block().hash)
+        
+        self.blockchain.chain.append(Block(4, [], 1, "bad_hash"))
+        self.assertFalse(self.blockchain.is_chain_valid())
+        
+        self.blockchain.chain.pop()
+        self.assertTrue(self.blockchain.is_chain_valid())
+        self.assertTrue(self.blockchain.force_revalidate())
+    
+    def test_get_transaction_by_hash(self):
+        """Test transaction lookup through the chain index."""
+        genesis_transaction = self.blockchain.chain[0].transactions[0]
+        self.assertIs(self.blockchain.get_transaction_by_hash(genesis_transaction.hash), genesis_transaction)
+        
+        transaction = Transaction("sender", "recipient", 10.0)
+        previous_hash = self.blockchain.get_latest_block().hash
+        self.blockchain.chain.append(Block(1, [transaction], 1, previous_hash))
+        self.assertIs(self.blockchain.get_transaction_by_hash(transaction.hash), transaction)
+        
+        self.blockchain.clear_to_genesis()
+        self.assertIsNone(self.blockchain.get_transaction_by_hash(transaction.hash))
+        self.assertIsNone(self.blockchain.get_transaction_by_hash("missing"))
+    
+    def test_get_transactions_for_address(self):
+        """Test address history follows new blocks and in-place edits."""
+        self.assertEqual(self.blockchain.get_transactions_for_address("alice"), [])
+        
+        received = Transaction("0", "alice", 100.0)
+        previous_hash = self.blockchain.get_latest_block().hash
+        self.blockchain.chain.append(Block(1, [received], 1, previous_hash))
+        self.assertEqual(self.blockchain.get_transactions_for_address("alice"), [received])
+        
+        sent = Transaction("alice", "bob", 40.0)
+        self.blockchain.chain[1].transactions.append(sent)
+        self.assertEqual(self.blockchain.get_transactions_for_address("alice"), [received, sent])
+        self.assertEqual(self.blockchain.get_balance("alice"), 60.0)
+    
+    def test_get_transactions_for_address_tracks_buried_edits(self):
+        """Test address history follows edits to transactions below the tip."""
+        received = Transaction("0", "alice", 100.0)
+        previous_hash = self.blockchain.get_latest_block().hash
+        self.blockchain.chain.append(Block(1, [received], 1, previous_hash))
+        self.blockchain.chain.append(Block(2, [], 1, self.blockchain.chain[1].hash))
+        self.assertEqual(self.blockchain.get_balance("alice"), 100.0)
+        
+        received.recipient = "carol"
+        received.hash = received.calculate_hash()
+        
+        self.assertEqual(self.blockchain.get_transactions_for_address("alice"), [])
+        self.assertEqual(self.blockchain.get_transactions_for_address("carol"), [received])
+        self.assertIs(self.blockchain.get_transaction_by_hash(received.hash), received)
+        self.assertEqual(self.blockchain.get_balance("alice"), 0.0)
+    
     def test_get_chain(self):
         """Test getting chain data."""
         chain_data = self.blockchain.get_chain()
@@ -438,6 +572,45 @@ class TestBlockchain(unittest.TestCase):
         self.assertTrue(success)
         self.assertEqual(len(self.blockchain.chain), 5)
     
+    def test_clear_to_genesis(self):
+        """Test resetting a chain back to its genesis block."""
+        genesis_block = self.blockchain.chain[0]
+        self.blockchain.difficulty = 1
+        
+        # Public-key senders, so the signatures verify and the mempool accepts them
+        mined = Transaction(self.wallet.public_key, "recipient", 10.0)
+        mined.sign_transaction(self.wallet.private_key)
+        self.assertTrue(self.blockchain.add_transaction(mined))
+        self.assertIsNotNone(self.blockchain.mine_block(self.wallet.address))
+        
+        pending = Transaction(self.wallet.public_key, "recipient", 5.0)
+        pending.sign_transaction(self.wallet.private_key)
+        self.assertTrue(self.blockchain.add_transaction(pending))
+        
+        self.assertEqual(len(self.blockchain.chain), 2)
+        self.assertEqual(len(self.blockchain.mempool), 1)
+        
+        self.blockchain.clear_to_genesis()
+        
+        self.assertEqual(len(self.blockchain.chain), 1)
+        self.assertIs(self.blockchain.chain[0], genesis_block)
+        self.assertEqual(self.blockchain.mempool.get_transaction_count(), 0)
+        self.assertTrue(self.blockchain.validate_chain())
+    
+    def test_replace_chain_rejects_edited_shared_block(self):
+        """Test a block edited in place after validation is checked again on replacement."""
+        transaction = Transaction("sender", "recipient", 10.0)
+        with patch.object(Transaction, 'is_valid', return_value=True):
+            self.blockchain.chain.append(Block(1, [transaction], 1, self.blockchain.chain[0].hash))
+            self.blockchain.chain.append(Block(2, [], 1, self.blockchain.chain[1].hash))
+            self.assertTrue(self.blockchain.is_chain_valid())
+            
+            transaction.amount = 1000.0
+            longer_chain = self.blockchain.chain + [Block(3, [], 1, self.blockchain.chain[2].hash)]
+            
+            self.assertFalse(self.blockchain.replace_chain(longer_chain))
+        self.assertEqual(len(self.blockchain.chain), 3)
+    
     def test_replace_chain_invalid(self):
         """Test chain replacement with invalid chain."""
         # Try to replace with shorter chain
@@ -452,12 +625,12 @@ class TestMempool(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.mempool = Mempool()
-        self.wallet = Wallet()
+        self.wallet = _WALLET
     
     def test_mempool_creation(self):
         """Test mempool creation."""
         self.assertIsNotNone(self.mempool.transactions)
-        self.assertEqual(len(self.mempool.transactions), 0)
+        self.assertEqual(len(self.mempool), 0)
         self.assertGreater(self.mempool.max_size, 0)
     
     def test_add_transaction(self):
@@ -466,7 +639,7 @@ class TestMempool(unittest.TestCase):
         
         success = self.mempool.add_transaction(transaction)
         self.assertTrue(success)
-        self.assertEqual(len(self.mempool.transactions), 1)
+        self.assertEqual(len(self.mempool), 1)
     
     def test_add_invalid_transaction(self):
         """Test adding invalid transaction."""
@@ -474,7 +647,7 @@ class TestMempool(unittest.TestCase):
         
         success = self.mempool.add_transaction(transaction)
         self.assertFalse(success)
-        self.assertEqual(len(self.mempool.transactions), 0)
+        self.assertEqual(len(self.mempool), 0)
     
     def test_add_duplicate_transaction(self):
         """Test adding duplicate transaction."""
@@ -487,7 +660,8 @@ class TestMempool(unittest.TestCase):
         # Add second time (should fail)
         success2 = self.mempool.add_transaction(transaction)
         self.assertFalse(success2)
-        self.assertEqual(len(self.mempool.transactions), 1)
+        self.assertEqual(len(self.mempool), 1)
+        self.assertIs(self.mempool.get_transaction_by_hash(transaction.hash), transaction)
     
     def test_remove_transaction(self):
         """Test removing transaction."""
@@ -496,7 +670,7 @@ class TestMempool(unittest.TestCase):
         
         success = self.mempool.remove_transaction(transaction.hash)
         self.assertTrue(success)
-        self.assertEqual(len(self.mempool.transactions), 0)
+        self.assertEqual(len(self.mempool), 0)
     
     def test_get_transactions(self):
         """Test getting transactions."""
@@ -537,7 +711,7 @@ class TestMempool(unittest.TestCase):
         hashes_to_clear = [transactions[0].hash, transactions[1].hash]
         self.mempool.clear_transactions(hashes_to_clear)
         
-        self.assertEqual(len(self.mempool.transactions), 1)
+        self.assertEqual(len(self.mempool), 1)
         self.assertEqual(self.mempool.transactions[0].hash, transactions[2].hash)
     
     def test_prioritize_transactions(self):
@@ -558,6 +732,34 @@ class TestMempool(unittest.TestCase):
         self.assertEqual(prioritized[1].amount, 10.0)
         self.assertEqual(prioritized[2].amount, 5.0)
     
+    def test_prioritize_transactions_after_edit(self):
+        """Test prioritization follows a pending transaction edited in place."""
+        tx1 = Transaction("sender1", "recipient1", 5.0)
+        tx2 = Transaction("sender2", "recipient2", 15.0)
+        # Only the fee ordering is under test, not signatures
+        with patch.object(Transaction, 'is_valid', return_value=True):
+            self.mempool.add_transaction(tx1)
+            self.mempool.add_transaction(tx2)
+        
+        tx1.amount = 25.0
+        
+        self.assertEqual(self.mempool.prioritize_transactions(), [tx1, tx2])
+        self.assertEqual(self.mempool.get_transactions_for_block(max_transactions=1), [tx1])
+    
+    def test_get_transactions_for_block_skips_removed(self):
+        """Test removed transactions never come back from the fee heap."""
+        transactions = [Transaction(f"sender{i}", f"recipient{i}", float(i + 1)) for i in range(6)]
+        with patch.object(Transaction, 'is_valid', return_value=True):
+            self.mempool.add_transactions(transactions)
+        
+        self.mempool.remove_transaction(transactions[5].hash)
+        self.mempool.clear_transactions([transactions[4].hash, transactions[2].hash])
+        
+        self.assertEqual(self.mempool.get_transactions_for_block(max_transactions=2),
+                         [transactions[3], transactions[1]])
+        self.assertEqual(self.mempool.prioritize_transactions(),
+                         [transactions[3], transactions[1], transactions[0]])
+    
     def test_get_transactions_for_block(self):
         """Test getting transactions for block."""
         # Add more transactions than block limit